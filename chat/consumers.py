@@ -38,6 +38,9 @@ class ChatConsumer(AsyncWebsocketConsumer):
     - {"type": "error", ...}             - Error occurred
     - {"type": "ack", ...}               - Message acknowledged
     """
+
+    # Chat, presence and read receipts run on their own layer (see CHANNEL_LAYERS)
+    channel_layer_alias = 'chat'
     
     async def connect(self):
         """Handle WebSocket connection with presence broadcast."""
@@ -0,0 +1,57 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Concat
+from django.utils import timezone
+
+from consultants.models import ClientServiceRequest
+from consultants.signals import WIP_SOURCE_PHASES
+from core_auth.utils import invalidate_consultant_clients, invalidate_dashboards
+from document_vault.models import Document
+
+
+def _document_count(documents):
+    counts = documents.order_by().values('client').annotate(total=Count('pk')).values('total')
+    return Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+
+
+class Command(BaseCommand):
+    help = "Move requests whose required documents are all verified to WIP (catches up missed auto-progress signals)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Show what would change without writing to DB.",
+        )
+
+    def handle(self, *args, **options):
+        # Same linkage the auto_progress_to_wip signal uses: "Required for <service title>"
+        required_docs = Document.objects.filter(
+            client=OuterRef('client'),
+            description__icontains=Concat(Value('Required for '), OuterRef('service__title')),
+        )
+        stuck = ClientServiceRequest.objects.filter(
+            status__in=WIP_SOURCE_PHASES,
+            service__isnull=False,
+        ).annotate(
+            total_docs=_document_count(required_docs),
+            verified_docs=_document_count(required_docs.filter(status='VERIFIED')),
+        ).filter(total_docs__gt=0, verified_docs=F('total_docs'))
+
+        rows = list(stuck.values_list('id', 'client_id', 'assigned_consultant__user_id'))
+        request_ids = [request_id for request_id, _client_id, _consultant_id in rows]
+        if options["dry_run"]:
+            self.stdout.write(f"DRY RUN: would move {len(request_ids)} request(s) to WIP: {request_ids}")
+            return
+
+        # Bulk update: the per-save timeline and document-sync signals do not fire here.
+        # The phase is re-checked so a request moved on since the scan is left alone.
+        moved = ClientServiceRequest.objects.filter(id__in=request_ids, status__in=WIP_SOURCE_PHASES).update(
+            status='wip',
+            updated_at=timezone.now(),
+        )
+        # ...so drop the cached lists and dashboards that core_auth.signals would have
+        consultant_user_ids = [consultant_id for _request_id, _client_id, consultant_id in rows]
+        invalidate_consultant_clients(consultant_user_ids)
+        invalidate_dashboards([client_id for _request_id, client_id, _consultant_id in rows] + consultant_user_ids)
+        self.stdout.write(self.style.SUCCESS(f"Moved {moved} request(s) to WIP"))
@@ -41,7 +41,7 @@ class ConsultantServiceProfileSerializer(serializers.ModelSerializer):
     practice_type = serializers.CharField(source='application.practice_type', read_only=True, allow_blank=True, allow_null=True)
     
     def get_full_name(self, obj):
-        return obj.user.get_full_name() or obj.user.username
+        return obj.user.full_name
 
     def validate_pan_number(self, value):
         if value in (None, ''):
@@ -122,7 +122,7 @@ class ConsultantReviewSerializer(serializers.ModelSerializer):
     client_email = serializers.EmailField(source='client.email', read_only=True)
     
     def get_client_name(self, obj):
-        return obj.client.get_full_name() or obj.client.username
+        return obj.client.full_name
         
     class Meta:
         model = ConsultantReview
@@ -152,7 +152,7 @@ class ClientServiceRequestSerializer(serializers.ModelSerializer):
     order_variant_name = serializers.SerializerMethodField()
     
     def get_client_name(self, obj):
-        return obj.client.get_full_name() or obj.client.username
+        return obj.client.full_name
 
     def get_order_variant_name(self, obj):
         match = re.search(r'order #(\d+)', obj.notes or '')
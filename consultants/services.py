@@ -350,7 +350,7 @@ def drop_consultant_from_service(service_request_id, consultant_profile, reason_
         try:
             from channels.layers import get_channel_layer
             from asgiref.sync import async_to_sync
-            channel_layer = get_channel_layer()
+            channel_layer = get_channel_layer('notifications')
             if channel_layer:
                 async_to_sync(channel_layer.group_send)(
                     f'user_{user_id}',
@@ -2,7 +2,7 @@ import logging
 
 from django.db.models.signals import post_save, pre_save, post_delete
 from django.dispatch import receiver
-from django.db.models import Avg
+from django.db.models import Avg, Count, Q
 from .models import (
     ClientServiceRequest,
     ConsultantServiceExpertise,
@@ -13,6 +13,9 @@ from core_auth.models import ClientProfile
 
 logger = logging.getLogger(__name__)
 
+# Document collection phases a request leaves once every required document is verified
+WIP_SOURCE_PHASES = ['assigned', 'doc_pending', 'under_review', 'under_query']
+
 
 @receiver(post_save, sender=ConsultantServiceExpertise)
 def auto_add_consultant_to_topic(sender, instance, created, **kwargs):
@@ -339,11 +342,10 @@ def auto_progress_to_wip(sender, instance, **kwargs):
     
     # Find active service request for this client matching the title
     # We target active phases where document collection happens
-    target_phases = ['assigned', 'doc_pending', 'under_review', 'under_query']
     service_req = ClientServiceRequest.objects.filter(
         client=client,
         service__title__iexact=service_title,
-        status__in=target_phases
+        status__in=WIP_SOURCE_PHASES
     ).first()
     
     if service_req:
@@ -354,19 +356,20 @@ def auto_progress_to_wip(sender, instance, **kwargs):
             description__icontains=f"Required for {service_title}"
         )
         
-        non_verified = all_reqs.exclude(status='VERIFIED')
-        non_verified_count = non_verified.count()
+        counts = all_reqs.aggregate(total=Count('id'), verified=Count('id', filter=Q(status='VERIFIED')))
+        non_verified_count = counts['total'] - counts['verified']
         
-        if all_reqs.exists() and non_verified_count == 0:
+        if counts['total'] > 0 and non_verified_count == 0:
             # All documents are confirmed! Move to WIP.
             service_req.status = 'wip'
-            service_req.save()
-            print(f"🚀 [Signal] Auto-progressed {client.email}'s {service_title} to WIP (All {all_reqs.count()} docs verified)")
+            service_req.save(update_fields=['status', 'updated_at'])
+            print(f"🚀 [Signal] Auto-progressed {client.email}'s {service_title} to WIP (All {counts['total']} docs verified)")
         else:
-            titles = ", ".join([d.title for d in non_verified[:3]])
+            non_verified = all_reqs.exclude(status='VERIFIED')
+            titles = ", ".join(non_verified.values_list('title', flat=True)[:3])
             print(f"⏳ [Signal] {non_verified_count} docs still not verified for {service_title} (e.g., {titles})")
     else:
-        print(f"ℹ️ [Signal] No active {target_phases} request found for '{service_title}'.")
+        print(f"ℹ️ [Signal] No active {WIP_SOURCE_PHASES} request found for '{service_title}'.")
 
 
 @receiver(post_save, sender='document_vault.SharedReport')
@@ -386,11 +389,11 @@ def auto_progress_to_review(sender, instance, created, **kwargs):
         client=client_user,
         assigned_consultant__user=consultant_user,
         status__in=['wip', 'under_review', 'under_query', 'revision_pending']
-    )
+    ).select_related('service')
 
     for req in service_reqs:
         req.status = 'final_review'
-        req.save()
+        req.save(update_fields=['status', 'updated_at'])
         print(f"✅ [Signal] Auto-moved service '{req.service.title}' to Final Review due to report upload.")
 
 
@@ -94,7 +94,7 @@ def _push_ws_notification(user_id: int, payload: dict):
         from channels.layers import get_channel_layer
         from asgiref.sync import async_to_sync
 
-        channel_layer = get_channel_layer()
+        channel_layer = get_channel_layer('notifications')
         if channel_layer is None:
             return
         async_to_sync(channel_layer.group_send)(
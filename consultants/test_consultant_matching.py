@@ -69,3 +69,9 @@ class ConsultantMatchingTestCase(TestCase):
         response = self.client.post('/api/consultants/services/match-cart/', {'titles': ["pan application"]}, format='json')
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.data['consultants']), 2)
+
+    def test_blank_titles_do_not_match_every_service(self):
+        """Verify a blank cart title is ignored rather than matching the whole catalogue."""
+        response = self.client.post('/api/consultants/services/match-cart/', {'titles': ["ITR Filing", "  "]}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['consultants']), 0)
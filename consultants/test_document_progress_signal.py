@@ -0,0 +1,63 @@
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+
+from consultants.models import ClientServiceRequest, ConsultantServiceProfile, Service, ServiceCategory
+from core_auth.models import User
+from core_auth.utils import consultant_clients_cache_key, dashboard_cache_key
+from document_vault.models import Document
+
+
+class AutoProgressToWipTests(TestCase):
+    def setUp(self):
+        self.consultant = consultant = User.objects.create_user(username='wip_consultant', password='password', role=User.CONSULTANT)
+        self.client_user = User.objects.create_user(username='wip_client', password='password', role=User.CLIENT)
+        service = Service.objects.create(category=ServiceCategory.objects.create(name='Tax'), title='ITR Filing')
+        self.request = ClientServiceRequest.objects.create(
+            client=self.client_user,
+            service=service,
+            assigned_consultant=ConsultantServiceProfile.objects.create(user=consultant, qualification='CA'),
+            status='doc_pending',
+        )
+        self.documents = [
+            Document.objects.create(
+                client=self.client_user, title=title, status='UPLOADED', description='Required for ITR Filing',
+            )
+            for title in ('PAN Card', 'Form 16')
+        ]
+
+    def _verify(self, document):
+        document.status = 'VERIFIED'
+        document.save()
+        self.request.refresh_from_db()
+
+    def test_request_moves_to_wip_once_every_document_is_verified(self):
+        self._verify(self.documents[0])
+        self.assertEqual(self.request.status, 'doc_pending')
+
+        self._verify(self.documents[1])
+        self.assertEqual(self.request.status, 'wip')
+
+    def test_command_catches_up_requests_the_signal_missed(self):
+        other_client = User.objects.create_user(username='wip_other', password='password', role=User.CLIENT)
+        other = ClientServiceRequest.objects.create(client=other_client, service=self.request.service, status='doc_pending')
+        Document.objects.create(client=other_client, title='PAN Card', description='Required for ITR Filing')
+        # Bulk updates skip post_save, like documents verified before the signal existed
+        Document.objects.filter(client=self.client_user).update(status='VERIFIED')
+        cached_keys = [
+            consultant_clients_cache_key(self.consultant.id),
+            dashboard_cache_key(self.consultant.id),
+            dashboard_cache_key(self.client_user.id),
+        ]
+        cache.set_many(dict.fromkeys(cached_keys, 'stale'))
+
+        with self.assertNumQueries(2):
+            call_command('progress_verified_requests', stdout=StringIO())
+
+        self.request.refresh_from_db()
+        other.refresh_from_db()
+        self.assertEqual(self.request.status, 'wip')
+        self.assertEqual(other.status, 'doc_pending')
+        self.assertEqual(cache.get_many(cached_keys), {})
@@ -6,10 +6,11 @@ lookup through active ClientServiceRequest rows.
 """
 
 
-def get_active_consultant_for_client(client_user):
+def get_active_consultant_profile_for_client(client_user):
     """
-    Return the consultant *User* for a client based on their most recently
-    updated active service request, or None if no active service exists.
+    Return the ConsultantServiceProfile (with its user joined) serving a
+    client through their most recently updated active service request, or
+    None if no active service exists.
     """
     from consultants.models import ClientServiceRequest
 
@@ -21,6 +22,17 @@ def get_active_consultant_for_client(client_user):
         .exclude(status__in=['completed', 'cancelled'])
         .order_by('-updated_at')
         .select_related('assigned_consultant__user')
+        # Only the consultant is returned; skip the free-text columns
+        .defer('notes', 'revision_notes', 'assigned_consultant__bio', 'assigned_consultant__certifications')
         .first()
     )
-    return active_req.assigned_consultant.user if active_req else None
+    return active_req.assigned_consultant if active_req else None
+
+
+def get_active_consultant_for_client(client_user):
+    """
+    Return the consultant *User* for a client based on their most recently
+    updated active service request, or None if no active service exists.
+    """
+    profile = get_active_consultant_profile_for_client(client_user)
+    return profile.user if profile else None
@@ -149,11 +149,10 @@ class ServiceViewSet(viewsets.ReadOnlyModelViewSet):
         # Find matching Service records by title (case-insensitive)
         from django.db.models import Q, Count
         title_q = Q()
-        for title in titles:
-            t = title.strip()
-            # Try exact match first, then fallback to partial match
-            # This handles cases where the frontend sends "ITR salary" instead of "ITR Salary Filing"
-            title_q |= Q(title__iexact=t) | Q(title__icontains=t)
+        for t in normalized_titles:
+            # Partial match (which also covers exact matches) handles cases where
+            # the frontend sends "ITR salary" instead of "ITR Salary Filing"
+            title_q |= Q(title__icontains=t)
         
         matched_services = Service.objects.filter(title_q, is_active=True)
         # Get unique IDs to ensure we count correctly even if duplicate titles were sent
@@ -1134,7 +1133,7 @@ class ClientServiceRequestViewSet(viewsets.ModelViewSet):
             )
             
             # Send real-time websocket notification
-            channel_layer = get_channel_layer()
+            channel_layer = get_channel_layer('notifications')
             async_to_sync(channel_layer.group_send)(
                 f"user_{consultant_user.id}",
                 {
@@ -1461,7 +1460,7 @@ class ClientServiceRequestViewSet(viewsets.ModelViewSet):
         )
 
         try:
-            channel_layer = get_channel_layer()
+            channel_layer = get_channel_layer('notifications')
             if channel_layer:
                 async_to_sync(channel_layer.group_send)(
                     f'user_{chosen.user_id}',
@@ -49,10 +49,10 @@ class ConsultationBookingSerializer(serializers.ModelSerializer):
         ]
     
     def get_consultant_name(self, obj):
-        return f"{obj.consultant.first_name} {obj.consultant.last_name}".strip() or obj.consultant.username
+        return obj.consultant.full_name
     
     def get_client_name(self, obj):
-        return f"{obj.client.first_name} {obj.client.last_name}".strip() or obj.client.username
+        return obj.client.full_name
     
     def to_internal_value(self, data):
         # Allow topic to be looked up by name if a string is provided
@@ -113,6 +113,7 @@ AUTH_USER_MODEL = 'core_auth.User'
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'django.middleware.gzip.GZipMiddleware',  # Compress JSON API responses
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'core_auth.middleware.DisableCSRFForAPIMiddleware',  # Must be before CsrfViewMiddleware
@@ -146,6 +147,9 @@ WSGI_APPLICATION = 'core.wsgi.application'
 ASGI_APPLICATION = 'core.asgi.application'
 
 # Django Channels Layer (Redis Cloud)
+# Chat and notification traffic get their own named layers so a burst on one
+# cannot starve the other. Both fall back to REDIS_URL when no dedicated
+# endpoint is configured (e.g. 'redis://host/1' for a separate logical DB).
 CHANNEL_LAYERS = {
     'default': {
         'BACKEND': 'channels_redis.core.RedisChannelLayer',
@@ -153,6 +157,18 @@ CHANNEL_LAYERS = {
             'hosts': [os.getenv('REDIS_URL')],
         },
     },
+    'chat': {
+        'BACKEND': 'channels_redis.core.RedisChannelLayer',
+        'CONFIG': {
+            'hosts': [os.getenv('REDIS_CHAT_URL', os.getenv('REDIS_URL'))],
+        },
+    },
+    'notifications': {
+        'BACKEND': 'channels_redis.core.RedisChannelLayer',
+        'CONFIG': {
+            'hosts': [os.getenv('REDIS_NOTIF_URL', os.getenv('REDIS_URL'))],
+        },
+    },
 }
 
 
@@ -173,6 +189,7 @@ DATABASES = {
 TASKS = {
     'default': {
         'BACKEND': 'django_tasks.backends.immediate.ImmediateBackend',
+        'QUEUES': ['default', 'otp'],
     },
 }
 
@@ -129,6 +129,8 @@ DATABASES['default']['OPTIONS']['keepalives_count'] = 5     # 5 failed probes =
 # REDIS / CHANNEL LAYERS (for WebSocket)
 # =============================================================================
 
+# Chat (messages, presence, read receipts) and notifications are split into
+# separate layers so each traffic class can be scaled on its own Redis.
 CHANNEL_LAYERS = {
     'default': {
         'BACKEND': 'channels_redis.core.RedisChannelLayer',
@@ -138,6 +140,22 @@ CHANNEL_LAYERS = {
             'expiry': 10,
         },
     },
+    'chat': {
+        'BACKEND': 'channels_redis.core.RedisChannelLayer',
+        'CONFIG': {
+            'hosts': [os.getenv('REDIS_CHAT_URL', os.environ['REDIS_URL'])],
+            'capacity': 1500,
+            'expiry': 10,
+        },
+    },
+    'notifications': {
+        'BACKEND': 'channels_redis.core.RedisChannelLayer',
+        'CONFIG': {
+            'hosts': [os.getenv('REDIS_NOTIF_URL', os.environ['REDIS_URL'])],
+            'capacity': 1500,
+            'expiry': 10,
+        },
+    },
 }
 
 # =============================================================================
@@ -239,16 +257,31 @@ SIMPLE_JWT = {
 # =============================================================================
 import sentry_sdk
 
+# Error events are always sent; sampling below only applies to performance
+# traces and profiles, which otherwise cost CPU and egress on every request.
+SENTRY_TRACES_SAMPLE_RATE = float(os.getenv('SENTRY_TRACES_SAMPLE_RATE', '0.05'))
+SENTRY_PROFILES_SAMPLE_RATE = float(os.getenv('SENTRY_PROFILES_SAMPLE_RATE', '0.05'))
+
+
+def _sentry_traces_sampler(sampling_context):
+    # Keep distributed traces whole: follow the upstream service's decision
+    parent_sampled = sampling_context.get('parent_sampled')
+    if parent_sampled is not None:
+        return float(parent_sampled)
+    # WebSocket sessions are few and long-lived; trace all of them
+    if sampling_context.get('transaction_context', {}).get('op') == 'websocket.server':
+        return 1.0
+    return SENTRY_TRACES_SAMPLE_RATE
+
+
 sentry_sdk.init(
     dsn=os.environ.get('SENTRY_DSN', "https://cfb32d532836b45e114e94bd361c8c37@o4510925533741056.ingest.us.sentry.io/4510925550583808"),
     
-    # Set traces_sample_rate to 1.0 to capture 100%
-    # of transactions for performance monitoring.
-    traces_sample_rate=1.0,
+    # Head-based sampling: ~5% of HTTP transactions by default.
+    traces_sampler=_sentry_traces_sampler,
     
-    # Set profiles_sample_rate to 1.0 to profile 100%
-    # of sampled transactions.
-    profiles_sample_rate=1.0,
+    # Fraction of sampled transactions that are also profiled.
+    profiles_sample_rate=SENTRY_PROFILES_SAMPLE_RATE,
 
     # Send PII (like User IP/Cookies) to Sentry to help debug issues
     send_default_pii=True,
@@ -7,25 +7,30 @@ import os
 # Strong Admin URL from environment, default to 'admin/' if not set in dev
 admin_url = os.getenv('ADMIN_URL', 'admin/')
 
+# The resolver tries these in order, so the busiest prefixes come first:
+# session/token checks on every page load, notification polling, chat.
+# The three bare 'api/' includes must keep their relative order (core_auth
+# shadows a few onboarding aliases); none of them overlap the prefixed apps.
 urlpatterns = [
-    path(f'{admin_url}', admin.site.urls),
     path('api/', include('core_auth.urls')),
+    path('api/', include('notifications.urls')),
+    path('api/conversations/', include('chat.urls')),  # Real-time Chat
     path('api/consultations/', include('consultations.urls')),
     path('api/vault/', include('document_vault.urls')),
+    path('api/consultants/', include('consultants.urls')),
+    path('api/payments/', include('service_orders.urls')),
+    path('api/activity/', include('activity_timeline.urls')),
+    path('api/tickets/', include('tickets.urls')),  # Support Tickets
     path('api/chat/', include('chat_api.urls')),  # AI Chat API
     path('api/gst/', include('gst_reports.urls')),
     path('api/tds/', include('tds_api.urls')),
     path('api/calculator/', include('calculator.urls')),
-    path('api/payments/', include('service_orders.urls')),
-    path('api/consultants/', include('consultants.urls')),
     path('api/calls/', include('exotel_calls.urls')),
-    path('api/', include('notifications.urls')),
-    path('api/activity/', include('activity_timeline.urls')),
-    path('api/conversations/', include('chat.urls')),  # Real-time Chat
-    path('api/tickets/', include('tickets.urls')),  # Support Tickets
     
     # Onboarding Portal API
     path('api/', include('consultant_onboarding.urls')),
+
+    path(f'{admin_url}', admin.site.urls),
 ]
 
 if settings.DEBUG:
@@ -1,7 +1,79 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.core.cache import cache
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.settings import api_settings
 from rest_framework_simplejwt.tokens import AccessToken
 
+# Validated access tokens, keyed by the raw cookie value. A browser fires
+# several XHRs with the same cookie at once; only the first pays for the
+# signature check. Entries never outlive the token's own `exp` claim.
+TOKEN_CACHE_TTL_SECONDS = 30
+TOKEN_CACHE_MAX_SIZE = 4096
+
+# Validated refresh tokens, for tabs that refresh with the same cookie
+# within a few seconds of each other.
+REFRESH_TOKEN_CACHE_TTL_SECONDS = 15
+
+# Freshly minted (access, refresh) pairs, reused when the same user logs in
+# again moments later with unchanged claims.
+MINTED_TOKEN_CACHE_TTL_SECONDS = 10
+
+# Authenticated User rows are shared across workers through the cache and
+# dropped by the post_save/post_delete handlers in core_auth.signals and by
+# UserQuerySet.update for bulk updates.
+USER_CACHE_TTL_SECONDS = 60
+
+
+class TokenCache:
+    """Per-process, size-bounded TTL cache of tokens."""
+
+    def __init__(self, ttl_seconds, max_size=TOKEN_CACHE_MAX_SIZE):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key, value, exp=None):
+        """Cache `value` for the TTL, but never past `exp` (default: the token's own claim)."""
+        if exp is None:
+            exp = value.get('exp', 0)
+        expires_at = min(time.time() + self.ttl_seconds, exp)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# Kept separate so a refresh token can never be served as an access token.
+_token_cache = TokenCache(TOKEN_CACHE_TTL_SECONDS)
+refresh_token_cache = TokenCache(REFRESH_TOKEN_CACHE_TTL_SECONDS)
+minted_token_cache = TokenCache(MINTED_TOKEN_CACHE_TTL_SECONDS)
+
+
+def user_cache_key(user_id):
+    return f"auth_user:{user_id}"
+
+
 class CookieJWTAuthentication(JWTAuthentication):
     """
     Custom JWT Authentication that reads the token from HttpOnly cookies
@@ -9,13 +81,35 @@ class CookieJWTAuthentication(JWTAuthentication):
     """
     def authenticate(self, request):
         raw_token = request.COOKIES.get('access_token')
-        
+
         if raw_token is None:
             return None
 
         try:
-            validated_token = self.get_validated_token(raw_token)
+            validated_token = self.get_cached_validated_token(raw_token)
         except TokenError as e:
             raise InvalidToken(e.args[0])
 
         return self.get_user(validated_token), validated_token
+
+    def get_cached_validated_token(self, raw_token):
+        validated_token = _token_cache.get(raw_token)
+        if validated_token is None:
+            validated_token = self.get_validated_token(raw_token)
+            _token_cache.set(raw_token, validated_token)
+        return validated_token
+
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is None:
+            return super().get_user(validated_token)
+
+        key = user_cache_key(user_id)
+        user = cache.get(key)
+        if user is None:
+            user = super().get_user(validated_token)
+            cache.set(key, user, USER_CACHE_TTL_SECONDS)
+        else:
+            # Checked by User.save(): a cached copy may only write the columns it changed
+            user._from_auth_cache = True
+        return user
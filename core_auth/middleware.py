@@ -1,7 +1,37 @@
+from functools import lru_cache
+
 from django.http import JsonResponse
 from django.urls import resolve
 
 
+# URL names an authenticated user may reach before verifying their phone
+PHONE_VERIFICATION_ALLOWED_URLS = frozenset({
+    'send-otp',
+    'send-otp-status',
+    'verify-otp',
+    'token_obtain_pair',
+    'token_refresh',
+    'google-auth',
+    'client-profile',
+})
+
+
+# Requests that never need the phone check: admin, static/media assets and
+# CORS preflights. Checked before request.user is touched so these skip the
+# session/user lookup entirely.
+_SKIP_PREFIXES = ('/admin/', '/static/', '/media/')
+_SKIP_METHODS = frozenset({'OPTIONS'})
+
+
+@lru_cache(maxsize=4096)
+def _resolve_url_name(path):
+    """Resolve a path to its URL name; routes are fixed at boot so this is safe to memoize."""
+    try:
+        return resolve(path).url_name
+    except Exception:
+        return None
+
+
 class DisableCSRFForAPIMiddleware:
     """
     Disables CSRF enforcement for all /api/ routes.
@@ -27,8 +57,8 @@ class PreOnboardingMiddleware:
         self.get_response = get_response
 
     def __call__(self, request):
-        # Skip phone verification for admin URLs and superusers
-        if request.path.startswith('/admin/'):
+        # Skip phone verification for admin/static URLs, preflights and superusers
+        if request.method in _SKIP_METHODS or request.path.startswith(_SKIP_PREFIXES):
             return self.get_response(request)
         
         if hasattr(request, 'user') and request.user.is_authenticated:
@@ -37,23 +67,9 @@ class PreOnboardingMiddleware:
                 return self.get_response(request)
             
             if not request.user.is_phone_verified:
-                # List of allowed paths for unverified users
-                allowed_urls = [
-                    'send-otp',
-                    'verify-otp',
-                    'token_obtain_pair',
-                    'token_refresh',
-                    'google-auth',
-                    'client-profile',
-                ]
-                
-                # Resolve the current URL name
-                try:
-                    current_url_name = resolve(request.path_info).url_name
-                except Exception:
-                    current_url_name = None
-
-                if current_url_name not in allowed_urls:
+                current_url_name = _resolve_url_name(request.path_info)
+
+                if current_url_name not in PHONE_VERIFICATION_ALLOWED_URLS:
                     return JsonResponse(
                         {'error': 'Phone verification required.', 'code': 'phone_unverified'}, 
                         status=403
@@ -0,0 +1,23 @@
+# Generated by Django 6.0.1 on 2026-10-17 01:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('core_auth', '0011_magiclinktoken_pending_email_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='role',
+            field=models.CharField(choices=[('ADMIN', 'Admin'), ('CONSULTANT', 'Consultant'), ('CLIENT', 'Client')], db_index=True, default='CLIENT', max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['email'], name='core_auth_u_email_012c2e_idx'),
+        ),
+    ]
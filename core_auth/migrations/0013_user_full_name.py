@@ -0,0 +1,32 @@
+# Generated by Django 6.0.1 on 2026-10-17 01:06
+
+from django.db import migrations, models
+
+
+def populate_full_name(apps, schema_editor):
+    User = apps.get_model('core_auth', 'User')
+
+    users = list(User.objects.only('id', 'username', 'first_name', 'last_name'))
+    for user in users:
+        user.full_name = f"{user.first_name} {user.last_name}".strip() or user.username
+    User.objects.bulk_update(users, ['full_name'], batch_size=500)
+
+
+def noop(apps, schema_editor):
+    pass
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core_auth', '0012_user_role_email_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='full_name',
+            field=models.CharField(blank=True, editable=False, max_length=301),
+        ),
+        migrations.RunPython(populate_full_name, noop),
+    ]
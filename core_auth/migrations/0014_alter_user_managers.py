@@ -0,0 +1,20 @@
+# Generated by Django 6.0.1 on 2026-10-17 02:30
+
+import core_auth.models
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core_auth', '0013_user_full_name'),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name='user',
+            managers=[
+                ('objects', core_auth.models.UserManager()),
+            ],
+        ),
+    ]
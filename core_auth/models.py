@@ -1,9 +1,42 @@
 import uuid
 
+from django.core.cache import cache
 from django.db import models
-from django.contrib.auth.models import AbstractUser
+from django.contrib.auth.models import AbstractUser, UserManager as DjangoUserManager
 from django.utils import timezone
 
+
+class UserQuerySet(models.QuerySet):
+    def update(self, **kwargs):
+        """
+        A queryset update sends no post_save, so drop the users' cached
+        CookieJWTAuthentication copies here; otherwise e.g. a bulk
+        is_active=False would keep authenticating them until the TTL runs out.
+        It also skips save(), which keeps full_name in sync, so the name
+        columns can't be changed here.
+        """
+        from .authentication import user_cache_key
+
+        name_fields = {'first_name', 'last_name', 'username'} & set(kwargs)
+        if name_fields:
+            raise ValueError(
+                f"Can't update {', '.join(sorted(name_fields))} in bulk; "
+                "save each user so full_name stays in sync."
+            )
+
+        user_ids = list(self.values_list('pk', flat=True))
+        rows = super().update(**kwargs)
+        if user_ids:
+            cache.delete_many([user_cache_key(user_id) for user_id in user_ids])
+        return rows
+
+    update.alters_data = True
+
+
+class UserManager(DjangoUserManager.from_queryset(UserQuerySet)):
+    pass
+
+
 class User(AbstractUser):
     ADMIN = 'ADMIN'
     CONSULTANT = 'CONSULTANT'
@@ -15,10 +48,15 @@ class User(AbstractUser):
         (CLIENT, 'Client'),
     ]
     
-    role = models.CharField(max_length=20, choices=ROLE_CHOICES, default=CLIENT)
+    role = models.CharField(max_length=20, choices=ROLE_CHOICES, default=CLIENT, db_index=True)
     phone_number = models.CharField(max_length=15, unique=True, null=True, blank=True)
     is_phone_verified = models.BooleanField(default=False)
     is_onboarded = models.BooleanField(default=False)
+    # Denormalized display name ("First Last", or username when both are
+    # blank), kept in sync by save() so JWT claims don't rebuild it per token.
+    # Sized for two 150-character names plus the space. UserQuerySet.update()
+    # refuses the name fields, since a bulk UPDATE would leave this stale.
+    full_name = models.CharField(max_length=301, blank=True, editable=False)
     parent_account = models.ForeignKey(
         'self', 
         on_delete=models.CASCADE, 
@@ -28,9 +66,28 @@ class User(AbstractUser):
         help_text="If set, this user is a sub-account managed by the parent_account."
     )
 
+    objects = UserManager()
+
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Every login flow (Google, email, magic link) looks users up by email
+            models.Index(fields=['email']),
+        ]
+
     def __str__(self):
         return f"{self.username} ({self.role})"
 
+    def save(self, *args, **kwargs):
+        # Copies served from the auth cache can be up to a minute old; a full
+        # save would write those stale columns (is_active, role, ...) back
+        if getattr(self, '_from_auth_cache', False) and kwargs.get('update_fields') is None:
+            raise ValueError("User loaded from the auth cache; save it with update_fields.")
+        self.full_name = f"{self.first_name} {self.last_name}".strip() or self.username
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'first_name', 'last_name', 'username'} & set(update_fields):
+            kwargs['update_fields'] = {*update_fields, 'full_name'}
+        super().save(*args, **kwargs)
+
 class ConsultantProfile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='consultant_profile')
     max_capacity = models.IntegerField(default=10)
@@ -40,12 +97,28 @@ class ConsultantProfile(models.Model):
     def __str__(self):
         return f"Consultant: {self.user.username}"
 
+class ClientProfileQuerySet(models.QuerySet):
+    def delete(self):
+        """
+        Deleting a client means deleting its User. Delete the users in one
+        pass; the CASCADE removes these profiles along with their documents
+        and services, instead of one cascade per profile.
+        """
+        user_ids = list(self.values_list('user_id', flat=True))
+        return User.objects.filter(id__in=user_ids).delete()
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
+
 class ClientProfile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='client_profile')
     pan_number = models.CharField(max_length=10, null=True, blank=True)
     gstin = models.CharField(max_length=15, null=True, blank=True)
     gst_username = models.CharField(max_length=255, null=True, blank=True)
 
+    objects = ClientProfileQuerySet.as_manager()
+
     def __str__(self):
         return f"Client: {self.user.username}"
 
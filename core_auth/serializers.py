@@ -1,5 +1,8 @@
+from django.contrib.auth.models import update_last_login
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.settings import api_settings
 from rest_framework import permissions
+from core_auth.authentication import minted_token_cache
 
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     @classmethod
@@ -8,11 +11,37 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
 
         # Add custom claims
         token['user_role'] = user.role
-        token['full_name'] = f"{user.first_name} {user.last_name}".strip() or user.username
+        token['full_name'] = user.full_name
         token['is_phone_verified'] = user.is_phone_verified
 
         return token
 
+    def validate(self, attrs):
+        # Authenticate via TokenObtainSerializer, then mint through the shared cache
+        data = super(TokenObtainPairSerializer, self).validate(attrs)
+        data['access'], data['refresh'] = mint_auth_tokens(self.user)
+
+        if api_settings.UPDATE_LAST_LOGIN:
+            update_last_login(None, self.user)
+
+        return data
+
+
+def mint_auth_tokens(user):
+    """
+    Return (access, refresh) token strings for a user. A pair minted for the
+    same user and claims in the last few seconds is reused, so a burst of
+    logins signs once.
+    """
+    cache_key = (user.pk, user.role, user.full_name, user.is_phone_verified)
+    tokens = minted_token_cache.get(cache_key)
+    if tokens is None:
+        refresh = CustomTokenObtainPairSerializer.get_token(user)
+        access = refresh.access_token
+        tokens = (str(access), str(refresh))
+        minted_token_cache.set(cache_key, tokens, exp=access['exp'])
+    return tokens
+
 class IsConsultantUser(permissions.BasePermission):
     def has_permission(self, request, view):
         return bool(request.user and request.user.is_authenticated and request.user.role == 'CONSULTANT')
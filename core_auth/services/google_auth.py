@@ -0,0 +1,121 @@
+import hashlib
+import re
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from google.auth import exceptions as google_exceptions
+from google.auth import jwt as google_jwt
+from django.conf import settings
+from django.core.cache import cache
+
+GOOGLE_CERTS_URL = 'https://www.googleapis.com/oauth2/v1/certs'
+GOOGLE_USERINFO_URL = 'https://www.googleapis.com/oauth2/v3/userinfo'
+GOOGLE_ISSUERS = ('accounts.google.com', 'https://accounts.google.com')
+GOOGLE_REQUEST_TIMEOUT_SECONDS = 5
+GOOGLE_ID_TOKEN_CLOCK_SKEW_SECONDS = 10
+
+# Google's signing certificates are cached per process for as long as the
+# certs endpoint's Cache-Control allows. A token signed with a key we have
+# not seen (key rotation) forces a refetch, at most once per minute.
+GOOGLE_CERTS_DEFAULT_MAX_AGE_SECONDS = 3600
+GOOGLE_CERTS_MIN_REFETCH_SECONDS = 60
+
+# Access tokens can only be checked remotely, so a successful userinfo
+# lookup is shared across workers briefly (retries, double submits).
+GOOGLE_USERINFO_CACHE_TTL_SECONDS = 60
+
+# Shared keep-alive session for Google's OAuth endpoints, so logins reuse an
+# open TLS connection instead of handshaking with Google on every request.
+_GOOGLE_SESSION = requests.Session()
+_GOOGLE_SESSION.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=20))
+
+_certs_lock = threading.Lock()
+_certs_state = {'certs': {}, 'fetched_at': 0.0, 'expires_at': 0.0}
+
+
+def _allowed_client_ids():
+    # Main SaaS frontend + onboarding frontend may use different OAuth clients
+    return [cid for cid in [
+        settings.GOOGLE_CLIENT_ID,
+        getattr(settings, 'GOOGLE_ONBOARDING_CLIENT_ID', None),
+    ] if cid]
+
+
+def _certs_max_age(cache_control):
+    match = re.search(r'max-age=(\d+)', cache_control or '')
+    return int(match.group(1)) if match else GOOGLE_CERTS_DEFAULT_MAX_AGE_SECONDS
+
+
+def _get_google_certs(key_id=None):
+    """
+    Return Google's {key id: PEM certificate} mapping, fetching it when the
+    cached copy has expired or does not contain `key_id`.
+    Raises requests.RequestException if Google cannot be reached.
+    """
+    with _certs_lock:
+        now = time.time()
+        expired = now >= _certs_state['expires_at']
+        unknown_key = (
+            key_id is not None
+            and key_id not in _certs_state['certs']
+            and now - _certs_state['fetched_at'] >= GOOGLE_CERTS_MIN_REFETCH_SECONDS
+        )
+        if expired or unknown_key:
+            response = _GOOGLE_SESSION.get(GOOGLE_CERTS_URL, timeout=GOOGLE_REQUEST_TIMEOUT_SECONDS)
+            response.raise_for_status()
+            _certs_state['certs'] = response.json()
+            _certs_state['fetched_at'] = now
+            _certs_state['expires_at'] = now + _certs_max_age(response.headers.get('Cache-Control'))
+        return _certs_state['certs']
+
+
+def verify_google_id_token(id_token):
+    """
+    Verify a Google ID token's signature locally and check it was issued by
+    Google for one of our clients. The verified claims already include
+    email, given_name and family_name — no userinfo call is needed on top.
+    Returns (google_data: dict | None, error: str | None).
+    Raises requests.RequestException if Google's certificates cannot be fetched.
+    """
+    try:
+        key_id = google_jwt.decode_header(id_token).get('kid')
+        google_data = google_jwt.decode(
+            id_token,
+            certs=_get_google_certs(key_id),
+            clock_skew_in_seconds=GOOGLE_ID_TOKEN_CLOCK_SKEW_SECONDS,
+        )
+    except (ValueError, google_exceptions.GoogleAuthError):
+        return None, 'Invalid Google ID token'
+
+    if google_data.get('iss') not in GOOGLE_ISSUERS:
+        return None, 'Invalid Google ID token'
+
+    if google_data.get('aud') not in _allowed_client_ids():
+        return None, 'Token not issued for this app'
+
+    return google_data, None
+
+
+def fetch_google_userinfo(access_token):
+    """
+    Fetch the profile for a Google OAuth access token. The userinfo endpoint
+    both validates the token and returns the profile in one round trip.
+    Returns (google_data: dict | None, error: str | None).
+    Raises requests.RequestException if Google cannot be reached.
+    """
+    cache_key = 'g_userinfo:' + hashlib.sha256(access_token.encode()).hexdigest()
+    google_data = cache.get(cache_key)
+    if google_data is not None:
+        return google_data, None
+
+    google_response = _GOOGLE_SESSION.get(
+        GOOGLE_USERINFO_URL,
+        headers={'Authorization': f'Bearer {access_token}'},
+        timeout=GOOGLE_REQUEST_TIMEOUT_SECONDS,
+    )
+    if google_response.status_code != 200:
+        return None, 'Invalid Google Access token'
+    google_data = google_response.json()
+    cache.set(cache_key, google_data, GOOGLE_USERINFO_CACHE_TTL_SECONDS)
+    return google_data, None
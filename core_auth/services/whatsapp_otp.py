@@ -1,12 +1,57 @@
-import random
+import hmac
+import json
+import secrets
 import time
 import requests
 import logging
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from django.core.cache import cache
 from django.conf import settings
 
 logger = logging.getLogger(__name__)
 
+# Shared keep-alive session for the Meta Graph API: reuses the TLS connection
+# across OTP sends instead of handshaking with graph.facebook.com every time.
+# urllib3 does not retry POSTs on read errors or bad status, so a retry can
+# never deliver the same OTP twice; only failed connects are retried.
+_META_SESSION = requests.Session()
+_META_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=50,
+    max_retries=Retry(total=2, backoff_factor=0.2),
+))
+
+# Request body for the 'otp_authentication' template, serialized once. Only
+# the recipient and the OTP vary; both are plain digit strings, so they are
+# substituted into the JSON text without re-encoding the whole payload.
+# DIAGNOSTIC CONFIRMED: This specific template 'otp_authentication' requires both Body and URL params
+_OTP_PAYLOAD_TEMPLATE = json.dumps({
+    "messaging_product": "whatsapp",
+    "to": "__TO__",
+    "type": "template",
+    "template": {
+        "name": "otp_authentication",
+        "language": {"code": "en"},
+        "components": [
+            {
+                "type": "body",
+                "parameters": [
+                    {"type": "text", "text": "__OTP__"}
+                ]
+            },
+            {
+                "type": "button",
+                "sub_type": "url",
+                "index": "0",
+                "parameters": [
+                    {"type": "text", "text": "__OTP__"}
+                ]
+            }
+        ]
+    }
+}, separators=(',', ':'))
+
 # ─── Constants ───
 OTP_LENGTH = 6
 OTP_EXPIRY_SECONDS = 600        # 10 minutes
@@ -14,6 +59,11 @@ RESEND_COOLDOWN_SECONDS = 30    # 30 seconds between resends
 MAX_VERIFY_ATTEMPTS = 5         # Max wrong OTP attempts
 MAX_RESENDS_PER_HOUR = 5        # Max OTP sends per phone per hour
 
+# Delivery status recorded by send_otp_task for clients to poll
+OTP_SEND_PENDING = 'sending'
+OTP_SEND_SENT = 'sent'
+OTP_SEND_FAILED = 'failed'
+
 # ─── Cache key helpers ───
 def _otp_key(phone):
     return f"otp:{phone}"
@@ -27,45 +77,86 @@ def _resend_cooldown_key(phone):
 def _resend_count_key(phone):
     return f"otp_resend_count:{phone}"
 
+def _send_status_key(user_id, phone):
+    return f"otp_status:{user_id}:{phone}"
+
 
 def generate_otp():
-    """Generate a random 6-digit OTP."""
-    return ''.join([str(random.randint(0, 9)) for _ in range(OTP_LENGTH)])
+    """Generate a cryptographically secure 6-digit OTP."""
+    return f"{secrets.randbelow(10 ** OTP_LENGTH):0{OTP_LENGTH}d}"
 
 
 def store_otp(phone_number, otp):
     """Store OTP in cache with expiry and reset attempt counter."""
-    cache.set(_otp_key(phone_number), otp, OTP_EXPIRY_SECONDS)
-    cache.set(_attempts_key(phone_number), 0, OTP_EXPIRY_SECONDS)
-    # Set resend cooldown (30 seconds)
-    cache.set(_resend_cooldown_key(phone_number), time.time(), RESEND_COOLDOWN_SECONDS)
-    # Increment hourly resend counter
     resend_key = _resend_count_key(phone_number)
     count = cache.get(resend_key, 0)
+    # OTP, attempt counter and resend cooldown share one pipelined write.
+    # The cooldown key may outlive RESEND_COOLDOWN_SECONDS: can_resend_otp()
+    # measures elapsed time from the stored timestamp, not from the key's TTL.
+    # Every value is a plain int, which RedisCache stores raw instead of
+    # pickling; verify_otp() restores the OTP's leading zeros.
+    cache.set_many({
+        _otp_key(phone_number): int(otp),
+        _attempts_key(phone_number): 0,
+        _resend_cooldown_key(phone_number): int(time.time()),
+    }, OTP_EXPIRY_SECONDS)
+    # Increment hourly resend counter
     cache.set(resend_key, count + 1, 3600)  # 1 hour TTL
 
 
+def get_stored_otp(phone_number):
+    """
+    Return the pending OTP for a phone number as a digit string,
+    or None if it has expired or was already used.
+    """
+    stored_otp = cache.get(_otp_key(phone_number))
+    if stored_otp is None:
+        return None
+    return str(stored_otp).zfill(OTP_LENGTH)
+
+
 def can_resend_otp(phone_number):
     """
     Check if OTP can be resent.
     Returns (can_resend: bool, reason: str, wait_seconds: int)
     """
+    cooldown_key = _resend_cooldown_key(phone_number)
+    resend_key = _resend_count_key(phone_number)
+    cached = cache.get_many([cooldown_key, resend_key])
+
     # Check cooldown
-    cooldown_time = cache.get(_resend_cooldown_key(phone_number))
+    cooldown_time = cached.get(cooldown_key)
     if cooldown_time:
-        elapsed = time.time() - cooldown_time
+        elapsed = int(time.time()) - cooldown_time
         remaining = int(RESEND_COOLDOWN_SECONDS - elapsed)
         if remaining > 0:
             return False, f"Please wait {remaining} seconds before requesting a new OTP", remaining
 
     # Check hourly limit
-    resend_count = cache.get(_resend_count_key(phone_number), 0)
+    resend_count = cached.get(resend_key, 0)
     if resend_count >= MAX_RESENDS_PER_HOUR:
         return False, "Too many OTP requests. Please try again after some time.", 0
 
     return True, "", 0
 
 
+def set_otp_send_status(user_id, phone_number, send_status, message=''):
+    """Record the WhatsApp delivery outcome of a user's OTP to a phone number."""
+    cache.set(
+        _send_status_key(user_id, phone_number),
+        {'status': send_status, 'message': message},
+        OTP_EXPIRY_SECONDS,
+    )
+
+
+def get_otp_send_status(user_id, phone_number):
+    """
+    Return the last recorded delivery outcome as {'status', 'message'},
+    or None if this user was not sent an OTP to the number recently.
+    """
+    return cache.get(_send_status_key(user_id, phone_number))
+
+
 def send_whatsapp_otp(phone_number, otp):
     """
     Send OTP via Meta WhatsApp Cloud API using the 'otp_authentication' authentication template.
@@ -84,41 +175,20 @@ def send_whatsapp_otp(phone_number, otp):
     # Format phone: ensure no '+' prefix for the API
     formatted_phone = phone_number.lstrip('+')
 
+    if not formatted_phone.isdigit() or not otp.isdigit():
+        logger.error("Refusing to send WhatsApp OTP with a non-numeric phone number or code")
+        return False, "Invalid phone number. Please check and try again."
+
     headers = {
         "Authorization": f"Bearer {access_token}",
         "Content-Type": "application/json",
     }
 
     # Authentication template with Body + URL button (One-Tap Autofill)
-    # DIAGNOSTIC CONFIRMED: This specific template 'otp_authentication' requires both Body and URL params
-    payload = {
-        "messaging_product": "whatsapp",
-        "to": formatted_phone,
-        "type": "template",
-        "template": {
-            "name": "otp_authentication",
-            "language": {"code": "en"},
-            "components": [
-                {
-                    "type": "body",
-                    "parameters": [
-                        {"type": "text", "text": otp}
-                    ]
-                },
-                {
-                    "type": "button",
-                    "sub_type": "url",
-                    "index": "0",
-                    "parameters": [
-                        {"type": "text", "text": otp}
-                    ]
-                }
-            ]
-        }
-    }
+    body = _OTP_PAYLOAD_TEMPLATE.replace('__TO__', formatted_phone).replace('__OTP__', otp).encode()
 
     try:
-        response = requests.post(url, json=payload, headers=headers, timeout=15)
+        response = _META_SESSION.post(url, data=body, headers=headers, timeout=15)
         response_data = response.json()
 
         if response.status_code == 200:
@@ -154,33 +224,43 @@ def verify_otp(phone_number, otp):
     Verify OTP for a phone number.
     Returns (success: bool, message: str, remaining_attempts: int)
     """
-    stored_otp = cache.get(_otp_key(phone_number))
+    otp_key = _otp_key(phone_number)
+    attempts_key = _attempts_key(phone_number)
+    cached = cache.get_many([otp_key, attempts_key])
+    stored_otp = cached.get(otp_key)
 
     if stored_otp is None:
         return False, "OTP has expired. Please request a new one.", 0
 
     # Check attempts
-    attempts = cache.get(_attempts_key(phone_number), 0)
+    attempts = cached.get(attempts_key, 0)
     if attempts >= MAX_VERIFY_ATTEMPTS:
         # Clear the OTP — force re-request
-        cache.delete(_otp_key(phone_number))
-        cache.delete(_attempts_key(phone_number))
+        cache.delete_many([otp_key, attempts_key])
         return False, "Too many failed attempts. Please request a new OTP.", 0
 
-    if str(otp) != str(stored_otp):
-        attempts += 1
-        cache.set(_attempts_key(phone_number), attempts, OTP_EXPIRY_SECONDS)
+    # Constant-time compare so response timing doesn't reveal matching digits
+    if not hmac.compare_digest(str(otp).encode(), str(stored_otp).zfill(OTP_LENGTH).encode()):
+        # Count the miss atomically (Redis INCR keeps the key's TTL), so
+        # parallel guesses cannot all read the same count and slip past
+        # MAX_VERIFY_ATTEMPTS.
+        try:
+            attempts = cache.incr(attempts_key)
+        except ValueError:
+            # The OTP expired between the read and the increment
+            return False, "OTP has expired. Please request a new one.", 0
         remaining = MAX_VERIFY_ATTEMPTS - attempts
         if remaining <= 0:
-            cache.delete(_otp_key(phone_number))
-            cache.delete(_attempts_key(phone_number))
+            cache.delete_many([otp_key, attempts_key])
             return False, "Too many failed attempts. Please request a new OTP.", 0
         return False, f"Invalid OTP. {remaining} attempt(s) remaining.", remaining
 
     # ✅ OTP matches — cleanup cache
-    cache.delete(_otp_key(phone_number))
-    cache.delete(_attempts_key(phone_number))
-    cache.delete(_resend_cooldown_key(phone_number))
-    cache.delete(_resend_count_key(phone_number))
+    cache.delete_many([
+        otp_key,
+        attempts_key,
+        _resend_cooldown_key(phone_number),
+        _resend_count_key(phone_number),
+    ])
 
     return True, "Phone number verified successfully!", MAX_VERIFY_ATTEMPTS
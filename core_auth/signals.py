@@ -1,22 +1,99 @@
-from django.db.models.signals import post_delete
+from django.core.cache import cache
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
+from .authentication import user_cache_key
 from .models import ClientProfile, User
+from .utils import (
+    invalidate_consultant_clients,
+    invalidate_consultant_clients_for_client,
+    invalidate_dashboards,
+)
 
-@receiver(post_delete, sender=ClientProfile)
-def delete_user_on_client_profile_delete(sender, instance, **kwargs):
+# User fields shown in ConsultantClientsView
+CONSULTANT_CLIENT_USER_FIELDS = frozenset({
+    'first_name', 'last_name', 'username', 'full_name', 'email', 'is_onboarded', 'date_joined',
+})
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_auth_user(sender, instance, **kwargs):
+    """Drop the cached copy used by CookieJWTAuthentication.get_user."""
+    cache.delete(user_cache_key(instance.pk))
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_dashboard_on_user_change(sender, instance, **kwargs):
+    """The parent's dashboard lists its sub-accounts, so refresh it too."""
+    invalidate_dashboards([instance.pk, instance.parent_account_id])
+
+
+@receiver(post_save, sender=ClientProfile)
+@receiver(post_save, sender='consultants.ConsultantServiceProfile')
+def invalidate_dashboard_on_profile_change(sender, instance, **kwargs):
+    invalidate_dashboards([instance.user_id])
+
+
+@receiver(post_save, sender=User)
+def invalidate_consultant_clients_on_client_change(sender, instance, created, update_fields=None, **kwargs):
+    """A client's name, email or onboarding state changed; refresh their consultants' lists."""
+    if created or instance.role != User.CLIENT:
+        return
+    if update_fields is not None and not CONSULTANT_CLIENT_USER_FIELDS.intersection(update_fields):
+        return
+    invalidate_consultant_clients_for_client(instance.pk)
+
+
+@receiver(post_save, sender=ClientProfile)
+def invalidate_consultant_clients_on_profile_change(sender, instance, **kwargs):
+    invalidate_consultant_clients_for_client(instance.user_id)
+
+
+@receiver(pre_save, sender='consultants.ClientServiceRequest')
+def remember_previous_consultant(sender, instance, update_fields=None, **kwargs):
     """
-    Ensure the User record is deleted when the ClientProfile is deleted.
-    This ensures that 'deleting a client' from the profiles list correctly
-    triggers the CASCADE to documents and services.
+    Record who the request was assigned to, so a reassignment refreshes both lists.
+    An update_fields save that leaves assigned_consultant out cannot reassign,
+    so it skips the lookup.
     """
-    user_id = getattr(instance, 'user_id', None)
-    if not user_id:
+    instance._old_consultant_user_id = None
+    if not instance.pk:
         return
+    if update_fields is not None and not {'assigned_consultant', 'assigned_consultant_id'} & update_fields:
+        return
+    instance._old_consultant_user_id = sender.objects.filter(pk=instance.pk).exclude(
+        assigned_consultant_id=instance.assigned_consultant_id,
+    ).values_list('assigned_consultant__user_id', flat=True).first()
+
+
+@receiver(post_save, sender='consultants.ClientServiceRequest')
+@receiver(post_delete, sender='consultants.ClientServiceRequest')
+def invalidate_consultant_clients_on_request_change(sender, instance, **kwargs):
+    consultant_user_ids = [getattr(instance, '_old_consultant_user_id', None)]
+    if instance.assigned_consultant_id:
+        try:
+            consultant_user_ids.append(instance.assigned_consultant.user_id)
+        except ObjectDoesNotExist:
+            pass  # Consultant profile deleted in the same cascade
+    invalidate_consultant_clients(consultant_user_ids)
+    # Client advisor/compliance and consultant load are on their dashboards
+    invalidate_dashboards([instance.client_id, *consultant_user_ids])
 
-    user = User.objects.filter(id=user_id).first()
-    if not user:
+
+@receiver(post_delete, sender=ClientProfile)
+def delete_user_on_client_profile_delete(sender, instance, origin=None, **kwargs):
+    """
+    Ensure the User record is deleted when a single ClientProfile is deleted,
+    so that 'deleting a client' cascades to documents and services.
+
+    Bulk deletes go through ClientProfileQuerySet.delete, and profiles removed
+    by a User cascade already have their user on the way out; both are skipped.
+    """
+    if not isinstance(origin, ClientProfile):
         return
 
-    username = user.username
-    user.delete()
-    print(f"Deleted User {username} following ClientProfile deletion.")
+    user_id = getattr(instance, 'user_id', None)
+    if user_id:
+        User.objects.filter(id=user_id).delete()
@@ -1,8 +1,23 @@
 from django_tasks import task
 
-@task()
-def send_otp_task(phone_number, otp):
+from core_auth.services.whatsapp_otp import (
+    get_stored_otp, send_whatsapp_otp, set_otp_send_status,
+    OTP_SEND_SENT, OTP_SEND_FAILED,
+)
+
+
+@task(queue_name='otp')
+def send_otp_task(user_id, phone_number):
     """
-    Simulates sending an OTP by printing to the console.
+    Send the pending OTP for a phone number over WhatsApp outside the
+    request/response cycle. The OTP is read from the cache rather than
+    passed in, so it never sits in the task queue. The outcome is written
+    to the cache so the user can poll for it.
     """
-    print(f"\n--- [TASK] Sending OTP {otp} to {phone_number} ---\n")
+    otp = get_stored_otp(phone_number)
+    if otp is None:
+        success, message = False, "OTP expired. Please request a new one."
+    else:
+        success, message = send_whatsapp_otp(phone_number, otp)
+    set_otp_send_status(user_id, phone_number, OTP_SEND_SENT if success else OTP_SEND_FAILED, message)
+    return success, message
@@ -0,0 +1,39 @@
+from django.test import TestCase
+
+from core_auth.models import ClientProfile, User
+
+
+class ClientProfileDeleteTests(TestCase):
+    def _make_client(self, username):
+        user = User.objects.create_user(
+            username=username,
+            email=f'{username}@example.com',
+            password='password',
+            role=User.CLIENT,
+        )
+        ClientProfile.objects.create(user=user)
+        return user
+
+    def test_single_profile_delete_removes_user(self):
+        user = self._make_client('single_client')
+
+        user.client_profile.delete()
+
+        self.assertFalse(User.objects.filter(pk=user.pk).exists())
+
+    def test_queryset_delete_removes_users_in_bulk(self):
+        users = [self._make_client(f'bulk_client_{i}') for i in range(3)]
+        keep = self._make_client('kept_client')
+
+        ClientProfile.objects.exclude(user=keep).delete()
+
+        self.assertFalse(User.objects.filter(pk__in=[u.pk for u in users]).exists())
+        self.assertEqual(list(ClientProfile.objects.values_list('user_id', flat=True)), [keep.pk])
+        self.assertTrue(User.objects.filter(pk=keep.pk).exists())
+
+    def test_user_delete_cascades_to_profile(self):
+        user = self._make_client('cascade_client')
+
+        user.delete()
+
+        self.assertFalse(ClientProfile.objects.filter(user_id=user.pk).exists())
@@ -0,0 +1,66 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core_auth.models import ClientProfile, User
+
+
+class ClientProfilePatchTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='profile_client',
+            email='profile@example.com',
+            password='password',
+            role=User.CLIENT,
+            is_phone_verified=True,
+        )
+        self.profile = ClientProfile.objects.create(user=self.user)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def _updates(self, queries):
+        return [q['sql'] for q in queries if q['sql'].startswith('UPDATE')]
+
+    def test_patch_only_writes_sent_fields(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.patch(reverse('client-profile'), {'pan_number': 'ABCDE1234F'}, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        updates = self._updates(ctx.captured_queries)
+        self.assertEqual(len(updates), 1)
+        self.assertIn('core_auth_clientprofile', updates[0])
+        self.assertNotIn('gstin', updates[0])
+        self.profile.refresh_from_db()
+        self.assertEqual(self.profile.pan_number, 'ABCDE1234F')
+
+    def test_patch_name_updates_full_name(self):
+        response = self.client.patch(
+            reverse('client-profile'),
+            {'first_name': 'Asha', 'last_name': 'Mehta'},
+            format='json',
+        )
+
+        self.assertEqual(response.data['full_name'], 'Asha Mehta')
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.full_name, 'Asha Mehta')
+
+    def test_empty_patch_writes_nothing(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.patch(reverse('client-profile'), {}, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._updates(ctx.captured_queries), [])
+
+    def test_verifying_phone_marks_client_onboarded(self):
+        response = self.client.patch(
+            reverse('client-profile'),
+            {'phone_number': '9876543210', 'is_phone_verified': True},
+            format='json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.phone_number, '9876543210')
+        self.assertTrue(self.user.is_onboarded)
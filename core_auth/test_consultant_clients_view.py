@@ -0,0 +1,134 @@
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from consultants.models import ClientServiceRequest, ConsultantServiceProfile, Service, ServiceCategory
+from core_auth.models import ClientProfile, User
+
+
+class ConsultantClientsViewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.consultant = User.objects.create_user(
+            username='consultant',
+            email='consultant@example.com',
+            password='password',
+            role=User.CONSULTANT,
+            is_phone_verified=True,
+        )
+        self.profile = ConsultantServiceProfile.objects.create(user=self.consultant, qualification='CA')
+        category = ServiceCategory.objects.create(name='Tax')
+        self.itr = Service.objects.create(category=category, title='ITR Filing', price=Decimal('1500.00'))
+        self.gst = Service.objects.create(category=category, title='GST Return', price=Decimal('500.00'))
+
+        self.active_client = self._client('active_client', first_name='Asha', last_name='Mehta')
+        self.finished_client = self._client('finished_client')
+        ClientServiceRequest.objects.create(
+            client=self.active_client, service=self.itr, assigned_consultant=self.profile, status='wip',
+        )
+        ClientServiceRequest.objects.create(
+            client=self.active_client, service=self.gst, assigned_consultant=self.profile, status='completed',
+        )
+        ClientServiceRequest.objects.create(
+            client=self.finished_client, service=self.itr, assigned_consultant=self.profile, status='completed',
+        )
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.consultant)
+
+    def tearDown(self):
+        cache.clear()
+
+    def _client(self, username, **fields):
+        user = User.objects.create_user(
+            username=username,
+            email=f'{username}@example.com',
+            password='password',
+            role=User.CLIENT,
+            **fields,
+        )
+        ClientProfile.objects.create(user=user, pan_number='ABCDE1234F')
+        return user
+
+    def test_lists_clients_with_active_services_and_earnings(self):
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('consultant-clients'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 1)
+        client = response.data[0]
+        self.assertEqual(client['id'], self.active_client.id)
+        self.assertEqual(client['name'], 'Asha Mehta')
+        self.assertEqual(client['pan'], 'ABCDE1234F')
+        self.assertEqual(client['earnings'], 500.0)
+        self.assertEqual(client['active_requests'], [{
+            'id': ClientServiceRequest.objects.get(client=self.active_client, status='wip').id,
+            'service_title': 'ITR Filing',
+            'status': 'wip',
+            'status_display': 'Work In Progress',
+        }])
+
+    def test_clients_cannot_list_clients(self):
+        self.client.force_authenticate(user=self.active_client)
+
+        response = self.client.get(reverse('consultant-clients'))
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_list_is_cached_until_a_request_changes(self):
+        self.client.get(reverse('consultant-clients'))
+
+        with self.assertNumQueries(0):
+            cached = self.client.get(reverse('consultant-clients'))
+        self.assertEqual(len(cached.data), 1)
+
+        ClientServiceRequest.objects.create(
+            client=self.finished_client, service=self.gst, assigned_consultant=self.profile, status='assigned',
+        )
+
+        response = self.client.get(reverse('consultant-clients'))
+        self.assertEqual({c['id'] for c in response.data}, {self.active_client.id, self.finished_client.id})
+
+    def test_reassignment_refreshes_previous_consultant(self):
+        self.client.get(reverse('consultant-clients'))
+        other_user = User.objects.create_user(
+            username='other_consultant',
+            email='other@example.com',
+            password='password',
+            role=User.CONSULTANT,
+        )
+        other_profile = ConsultantServiceProfile.objects.create(user=other_user, qualification='CA')
+
+        service_request = ClientServiceRequest.objects.get(client=self.active_client, status='wip')
+        service_request.assigned_consultant = other_profile
+        service_request.save()
+
+        response = self.client.get(reverse('consultant-clients'))
+        self.assertEqual(response.data, [])
+
+    def test_unchanged_assignee_is_not_looked_up_again(self):
+        service_request = ClientServiceRequest.objects.get(client=self.active_client, status='wip')
+        service_request.status = 'review'
+
+        with CaptureQueriesContext(connection) as ctx:
+            service_request.save(update_fields=['status', 'updated_at'])
+
+        profile_lookups = [
+            q['sql'] for q in ctx.captured_queries
+            if 'consultants_consultantserviceprofile' in q['sql'] and 'consultants_clientservicerequest' in q['sql']
+        ]
+        self.assertEqual(profile_lookups, [])
+
+    def test_client_rename_refreshes_list(self):
+        self.client.get(reverse('consultant-clients'))
+
+        self.active_client.first_name = 'Asha K'
+        self.active_client.save(update_fields=['first_name'])
+
+        response = self.client.get(reverse('consultant-clients'))
+        self.assertEqual(response.data[0]['name'], 'Asha K Mehta')
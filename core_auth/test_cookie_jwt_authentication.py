@@ -0,0 +1,258 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+from rest_framework_simplejwt.utils import aware_utcnow
+
+from core_auth import authentication
+from core_auth.authentication import CookieJWTAuthentication
+from core_auth.models import User
+from core_auth.serializers import mint_auth_tokens
+
+
+class CookieJWTAuthenticationTests(TestCase):
+    def setUp(self):
+        authentication._token_cache.clear()
+        cache.clear()
+        self.factory = APIRequestFactory()
+        self.user = User.objects.create_user(
+            username='cookie_user',
+            email='cookie@example.com',
+            password='password',
+        )
+        self.raw_token = str(AccessToken.for_user(self.user))
+
+    def tearDown(self):
+        authentication._token_cache.clear()
+        cache.clear()
+
+    def _request(self):
+        request = self.factory.get('/api/auth/dashboard/')
+        request.COOKIES['access_token'] = self.raw_token
+        return request
+
+    def test_repeat_requests_verify_signature_once(self):
+        auth = CookieJWTAuthentication()
+        with patch.object(auth, 'get_validated_token', wraps=auth.get_validated_token) as mock_validate:
+            first_user, _ = auth.authenticate(self._request())
+            second_user, _ = auth.authenticate(self._request())
+
+        self.assertEqual(mock_validate.call_count, 1)
+        self.assertEqual(first_user, self.user)
+        self.assertEqual(second_user, self.user)
+
+    def test_missing_cookie_is_anonymous(self):
+        request = self.factory.get('/api/auth/dashboard/')
+
+        self.assertIsNone(CookieJWTAuthentication().authenticate(request))
+
+    def test_user_is_served_from_cache_until_saved(self):
+        auth = CookieJWTAuthentication()
+        auth.authenticate(self._request())
+
+        with self.assertNumQueries(0):
+            user, _ = auth.authenticate(self._request())
+        self.assertEqual(user.first_name, '')
+
+        self.user.first_name = 'Asha'
+        self.user.save(update_fields=['first_name'])
+
+        user, _ = auth.authenticate(self._request())
+        self.assertEqual(user.first_name, 'Asha')
+
+    def test_bulk_deactivation_drops_the_cached_user(self):
+        auth = CookieJWTAuthentication()
+        auth.authenticate(self._request())
+
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+
+        with self.assertRaises(AuthenticationFailed):
+            auth.authenticate(self._request())
+
+    def test_cached_copy_only_saves_the_columns_it_changed(self):
+        auth = CookieJWTAuthentication()
+        auth.authenticate(self._request())
+        cached_user, _ = auth.authenticate(self._request())
+        User.objects.filter(pk=self.user.pk).update(role=User.CONSULTANT)
+
+        cached_user.first_name = 'Asha'
+        with self.assertRaises(ValueError):
+            cached_user.save()
+        cached_user.save(update_fields=['first_name'])
+
+        self.user.refresh_from_db()
+        self.assertEqual((self.user.first_name, self.user.role), ('Asha', User.CONSULTANT))
+
+
+class CustomTokenRefreshViewTests(TestCase):
+    def setUp(self):
+        authentication.refresh_token_cache.clear()
+        authentication.minted_token_cache.clear()
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='refresh_user',
+            email='refresh@example.com',
+            password='password',
+        )
+        self.client.cookies['refresh_token'] = str(RefreshToken.for_user(self.user))
+
+    def tearDown(self):
+        authentication.refresh_token_cache.clear()
+        authentication.minted_token_cache.clear()
+        cache.clear()
+
+    def test_repeat_refreshes_decode_token_once(self):
+        raw_refresh = self.client.cookies['refresh_token'].value
+
+        with patch('core_auth.views.RefreshToken', wraps=RefreshToken) as mock_refresh_token:
+            first = self.client.post(reverse('token_refresh'))
+            # A second tab still holds the pre-rotation cookie
+            self.client.cookies['refresh_token'] = raw_refresh
+            second = self.client.post(reverse('token_refresh'))
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(mock_refresh_token.call_count, 1)
+        self.assertIn('access_token', second.cookies)
+
+    def test_cached_refresh_token_is_rejected_once_expired(self):
+        self.client.cookies['refresh_token'] = raw_refresh = str(RefreshToken.for_user(self.user))
+        self.assertEqual(self.client.post(reverse('token_refresh')).status_code, 200)
+
+        # Still inside the cache window, but past the token's exp claim
+        expired_at = aware_utcnow() + timedelta(days=8)
+        self.client.cookies['refresh_token'] = raw_refresh
+        with patch('core_auth.views.aware_utcnow', return_value=expired_at):
+            response = self.client.post(reverse('token_refresh'))
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_access_token_cookie_cannot_be_a_refresh_token(self):
+        raw_refresh = self.client.cookies['refresh_token'].value
+        self.client.post(reverse('token_refresh'))
+
+        request = APIRequestFactory().get('/api/auth/dashboard/')
+        request.COOKIES['access_token'] = raw_refresh
+
+        with self.assertRaises(authentication.InvalidToken):
+            CookieJWTAuthentication().authenticate(request)
+
+    @override_settings(DEBUG=False)
+    def test_refreshed_cookies_share_login_cookie_flags(self):
+        response = self.client.post(reverse('token_refresh'))
+
+        access, refresh = response.cookies['access_token'], response.cookies['refresh_token']
+        self.assertTrue(access['httponly'])
+        self.assertTrue(access['secure'])
+        self.assertEqual(access['max-age'], 3600)
+        self.assertEqual(refresh['max-age'], 86400 * 7)
+        self.assertEqual(refresh['samesite'], access['samesite'])
+
+    def test_refreshed_access_token_carries_login_claims(self):
+        self.client.post(reverse('token_refresh'))
+
+        with self.assertNumQueries(0):
+            response = self.client.post(reverse('token_refresh'))
+
+        access = AccessToken(response.cookies['access_token'].value)
+        self.assertEqual(access['user_role'], self.user.role)
+        self.assertEqual(access['full_name'], self.user.full_name)
+
+    def test_invalid_refresh_token_is_rejected(self):
+        self.client.cookies['refresh_token'] = 'not-a-token'
+
+        response = self.client.post(reverse('token_refresh'))
+
+        self.assertEqual(response.status_code, 401)
+
+
+class MintAuthTokensTests(TestCase):
+    def setUp(self):
+        authentication.minted_token_cache.clear()
+        self.user = User.objects.create_user(
+            username='login_user',
+            email='login@example.com',
+            password='password',
+        )
+
+    def tearDown(self):
+        authentication.minted_token_cache.clear()
+
+    def test_login_burst_reuses_minted_pair(self):
+        first = mint_auth_tokens(self.user)
+        second = mint_auth_tokens(self.user)
+
+        self.assertEqual(first, second)
+        self.assertEqual(AccessToken(first[0])['full_name'], self.user.full_name)
+
+    def test_changed_claims_mint_a_new_pair(self):
+        access, _refresh = mint_auth_tokens(self.user)
+
+        self.user.is_phone_verified = True
+        new_access, _new_refresh = mint_auth_tokens(self.user)
+
+        self.assertNotEqual(new_access, access)
+        self.assertTrue(AccessToken(new_access)['is_phone_verified'])
+
+    def test_password_login_sets_cookies_from_shared_pair(self):
+        response = APIClient().post(
+            reverse('token_obtain_pair'),
+            {'username': 'login_user', 'password': 'password'},
+            format='json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        access, refresh = mint_auth_tokens(self.user)
+        self.assertEqual(response.cookies['access_token'].value, access)
+        self.assertEqual(response.cookies['refresh_token'].value, refresh)
+
+
+class VerifySessionViewTests(TestCase):
+    def setUp(self):
+        authentication._token_cache.clear()
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='session_user',
+            email='session@example.com',
+            password='password',
+        )
+        self.client = APIClient()
+        self.client.cookies['access_token'] = mint_auth_tokens(self.user)[0]
+
+    def tearDown(self):
+        authentication._token_cache.clear()
+        authentication.minted_token_cache.clear()
+        cache.clear()
+
+    def test_repeat_checks_are_served_without_queries(self):
+        first = self.client.get(reverse('verify-session'))
+
+        with self.assertNumQueries(0):
+            second = self.client.get(reverse('verify-session'))
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(second.data['user']['email'], 'session@example.com')
+
+    def test_invalid_cookie_is_unauthorized(self):
+        self.client.cookies['access_token'] = 'garbage'
+
+        response = self.client.get(reverse('verify-session'))
+
+        self.assertEqual(response.status_code, 401)
+
+
+class LogoutViewTests(TestCase):
+    def test_logout_expires_both_auth_cookies(self):
+        response = APIClient().post(reverse('logout'))
+
+        self.assertEqual(response.status_code, 200)
+        for name in ('access_token', 'refresh_token'):
+            self.assertEqual(response.cookies[name].value, '')
+            self.assertEqual(response.cookies[name]['max-age'], 0)
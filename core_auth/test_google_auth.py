@@ -0,0 +1,206 @@
+import datetime
+import time
+from unittest.mock import patch
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.x509.oid import NameOID
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from google.auth import crypt
+from google.auth import jwt as google_jwt
+from rest_framework.test import APIClient
+
+from core_auth.models import ClientProfile, User
+from core_auth.services import google_auth
+from core_auth.services.google_auth import verify_google_id_token
+
+
+def _make_signing_key(key_id):
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, 'test')])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(private_key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .sign(private_key, hashes.SHA256())
+    )
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    signer = crypt.RSASigner.from_string(private_pem, key_id=key_id)
+    return signer, cert.public_bytes(serialization.Encoding.PEM).decode()
+
+
+@override_settings(GOOGLE_CLIENT_ID='web-client', GOOGLE_ONBOARDING_CLIENT_ID='onboarding-client')
+class VerifyGoogleIdTokenTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.signer, cls.cert_pem = _make_signing_key('key-1')
+
+    def setUp(self):
+        google_auth._certs_state.update({'certs': {}, 'fetched_at': 0.0, 'expires_at': 0.0})
+        cache.clear()
+        self.addCleanup(cache.clear)
+        patcher = patch.object(google_auth._GOOGLE_SESSION, 'get')
+        self.mock_get = patcher.start()
+        self.addCleanup(patcher.stop)
+        self._serve_certs({'key-1': self.cert_pem})
+
+    def _serve_certs(self, certs):
+        self.mock_get.return_value.json.return_value = certs
+        self.mock_get.return_value.headers = {'Cache-Control': 'public, max-age=600'}
+
+    def _token(self, signer=None, **claims):
+        now = int(time.time())
+        payload = {
+            'iss': 'https://accounts.google.com',
+            'aud': 'web-client',
+            'email': 'user@example.com',
+            'given_name': 'Asha',
+            'iat': now,
+            'exp': now + 3600,
+        }
+        payload.update(claims)
+        return google_jwt.encode(signer or self.signer, payload).decode()
+
+    def test_valid_token_verifies_and_certs_are_fetched_once(self):
+        first, first_error = verify_google_id_token(self._token())
+        second, second_error = verify_google_id_token(self._token(email='other@example.com'))
+
+        self.assertIsNone(first_error)
+        self.assertIsNone(second_error)
+        self.assertEqual(first['given_name'], 'Asha')
+        self.assertEqual(second['email'], 'other@example.com')
+        self.assertEqual(self.mock_get.call_count, 1)
+        self.assertEqual(self.mock_get.call_args.args[0], google_auth.GOOGLE_CERTS_URL)
+
+    def test_onboarding_client_audience_is_accepted(self):
+        _google_data, error = verify_google_id_token(self._token(aud='onboarding-client'))
+
+        self.assertIsNone(error)
+
+    def test_foreign_audience_is_rejected(self):
+        google_data, error = verify_google_id_token(self._token(aud='someone-else'))
+
+        self.assertIsNone(google_data)
+        self.assertEqual(error, 'Token not issued for this app')
+
+    def test_wrong_issuer_is_rejected(self):
+        _google_data, error = verify_google_id_token(self._token(iss='https://evil.example.com'))
+
+        self.assertEqual(error, 'Invalid Google ID token')
+
+    def test_expired_token_is_rejected(self):
+        now = int(time.time())
+        _google_data, error = verify_google_id_token(self._token(iat=now - 7200, exp=now - 3600))
+
+        self.assertEqual(error, 'Invalid Google ID token')
+
+    def test_malformed_token_is_rejected(self):
+        _google_data, error = verify_google_id_token('not-a-jwt')
+
+        self.assertEqual(error, 'Invalid Google ID token')
+
+    def test_token_signed_with_unknown_key_refetches_certs(self):
+        verify_google_id_token(self._token())
+        rotated_signer, rotated_pem = _make_signing_key('key-2')
+        self._serve_certs({'key-1': self.cert_pem, 'key-2': rotated_pem})
+        google_auth._certs_state['fetched_at'] -= google_auth.GOOGLE_CERTS_MIN_REFETCH_SECONDS
+
+        _google_data, error = verify_google_id_token(self._token(signer=rotated_signer))
+
+        self.assertIsNone(error)
+        self.assertEqual(self.mock_get.call_count, 2)
+
+    def test_forged_token_does_not_refetch_within_a_minute(self):
+        verify_google_id_token(self._token())
+        forged_signer, _forged_pem = _make_signing_key('key-forged')
+
+        _google_data, error = verify_google_id_token(self._token(signer=forged_signer))
+
+        self.assertEqual(error, 'Invalid Google ID token')
+        self.assertEqual(self.mock_get.call_count, 1)
+
+    def test_userinfo_uses_shared_session_with_timeout(self):
+        self.mock_get.return_value.status_code = 200
+        self.mock_get.return_value.json.return_value = {'email': 'user@example.com'}
+
+        google_data, error = google_auth.fetch_google_userinfo('access-token')
+
+        self.assertIsNone(error)
+        self.assertEqual(google_data['email'], 'user@example.com')
+        self.assertEqual(self.mock_get.call_args.kwargs['headers'], {'Authorization': 'Bearer access-token'})
+        self.assertEqual(self.mock_get.call_args.kwargs['timeout'], google_auth.GOOGLE_REQUEST_TIMEOUT_SECONDS)
+
+    def test_userinfo_is_cached_only_on_success(self):
+        self.mock_get.return_value.status_code = 401
+
+        _google_data, error = google_auth.fetch_google_userinfo('access-token')
+        self.assertEqual(error, 'Invalid Google Access token')
+
+        self.mock_get.return_value.status_code = 200
+        self.mock_get.return_value.json.return_value = {'email': 'user@example.com'}
+        google_auth.fetch_google_userinfo('access-token')
+        google_data, error = google_auth.fetch_google_userinfo('access-token')
+
+        self.assertIsNone(error)
+        self.assertEqual(google_data['email'], 'user@example.com')
+        self.assertEqual(self.mock_get.call_count, 2)
+
+
+@patch('core_auth.views.verify_google_id_token')
+class GoogleAuthViewTests(TestCase):
+    google_data = {'email': 'asha@example.com', 'given_name': 'Asha', 'family_name': 'Mehta'}
+
+    def _login(self):
+        return APIClient().post(reverse('google-auth'), {'id_token': 'token'}, format='json')
+
+    def test_new_user_gets_client_profile(self, mock_verify):
+        mock_verify.return_value = (self.google_data, None)
+
+        response = self._login()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data['created'])
+        user = User.objects.get(email='asha@example.com')
+        self.assertTrue(ClientProfile.objects.filter(user=user).exists())
+
+    def test_concurrent_first_login_reuses_inserted_user(self, mock_verify):
+        mock_verify.return_value = (self.google_data, None)
+        # Another request inserts the user between our lookup and our insert
+        existing = User.objects.create_user(username='asha', email='asha@example.com', role=User.CLIENT)
+        real_filter = User.objects.filter
+        lookups = []
+
+        def filter_missing_first(*args, **kwargs):
+            lookups.append(kwargs)
+            if len(lookups) == 1:
+                return User.objects.none()
+            return real_filter(*args, **kwargs)
+
+        with patch.object(User.objects, 'filter', side_effect=filter_missing_first):
+            response = self._login()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.data['created'])
+        self.assertEqual(User.objects.filter(email='asha@example.com').count(), 1)
+        self.assertEqual(response.data['full_name'], existing.full_name)
+
+    def test_consultant_cannot_use_google_login(self, mock_verify):
+        mock_verify.return_value = (self.google_data, None)
+        User.objects.create_user(username='asha', email='asha@example.com', role=User.CONSULTANT)
+
+        response = self._login()
+
+        self.assertEqual(response.status_code, 403)
@@ -0,0 +1,40 @@
+from django.test import TestCase
+from django.urls import reverse
+
+from core_auth.models import User
+
+
+class PreOnboardingMiddlewareTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='unverified_client',
+            email='unverified@example.com',
+            password='password',
+            role=User.CLIENT,
+            is_phone_verified=False,
+        )
+        self.client.force_login(self.user)
+
+    def test_unverified_user_blocked_from_other_endpoints(self):
+        response = self.client.get(reverse('user-dashboard'))
+
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.json()['code'], 'phone_unverified')
+
+    def test_unverified_user_can_reach_otp_endpoints(self):
+        response = self.client.get(reverse('send-otp-status'), {'phone_number': '9876543210'})
+
+        self.assertNotEqual(response.status_code, 403)
+
+    def test_verified_user_passes_through(self):
+        self.user.is_phone_verified = True
+        self.user.save(update_fields=['is_phone_verified'])
+
+        response = self.client.get(reverse('user-dashboard'))
+
+        self.assertNotEqual(response.status_code, 403)
+
+    def test_preflight_skips_phone_check(self):
+        response = self.client.options(reverse('user-dashboard'))
+
+        self.assertNotEqual(response.status_code, 403)
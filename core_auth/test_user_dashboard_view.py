@@ -0,0 +1,93 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from consultants.models import ClientServiceRequest, ConsultantServiceProfile, Service, ServiceCategory
+from core_auth.models import ClientProfile, User
+
+
+class UserDashboardViewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client_user = User.objects.create_user(
+            username='dash_client',
+            email='dash-client@example.com',
+            password='password',
+            role=User.CLIENT,
+            first_name='Asha',
+            is_phone_verified=True,
+        )
+        ClientProfile.objects.create(user=self.client_user, pan_number='ABCDE1234F')
+        self.api = APIClient()
+        self.api.force_authenticate(user=self.client_user)
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_client_dashboard_includes_advisor_and_compliance(self):
+        consultant = User.objects.create_user(
+            username='dash_consultant',
+            email='dash-consultant@example.com',
+            password='password',
+            role=User.CONSULTANT,
+            first_name='Ravi',
+            last_name='Iyer',
+        )
+        profile = ConsultantServiceProfile.objects.create(user=consultant, qualification='CA')
+        service = Service.objects.create(category=ServiceCategory.objects.create(name='Tax'), title='ITR Filing')
+        ClientServiceRequest.objects.create(
+            client=self.client_user, service=service, assigned_consultant=profile, status='wip',
+        )
+
+        response = self.api.get(reverse('user-dashboard'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['pan'], 'ABCDE1234F')
+        self.assertEqual(response.data['advisor']['name'], 'Ravi Iyer')
+        self.assertEqual(response.data['advisor']['qualification'], 'CA')
+        self.assertEqual(response.data['compliance'], {'pan_linked': True, 'gstin_linked': False})
+
+    def test_client_without_active_service_has_no_advisor(self):
+        response = self.api.get(reverse('user-dashboard'))
+
+        self.assertIsNone(response.data['advisor'])
+        self.assertEqual(response.data['full_name'], 'Asha')
+
+    def test_sub_accounts_are_listed_from_the_main_account(self):
+        sub = User.objects.create_user(
+            username='dash_sub',
+            password='password',
+            role=User.CLIENT,
+            parent_account=self.client_user,
+            first_name='Kid',
+        )
+        self.api.force_authenticate(user=sub)
+
+        response = self.api.get(reverse('user-dashboard'))
+
+        self.assertEqual(response.data['sub_accounts'], [
+            {'id': sub.id, 'first_name': 'Kid', 'last_name': '', 'username': 'dash_sub'},
+        ])
+
+    def test_dashboard_is_cached_until_profile_changes(self):
+        self.api.get(reverse('user-dashboard'))
+
+        with self.assertNumQueries(0):
+            cached = self.api.get(reverse('user-dashboard'))
+        self.assertEqual(cached.data['gst'], None)
+
+        profile = self.client_user.client_profile
+        profile.gstin = '27ABCDE1234F1Z5'
+        profile.save(update_fields=['gstin'])
+
+        response = self.api.get(reverse('user-dashboard'))
+        self.assertEqual(response.data['gst'], '27ABCDE1234F1Z5')
+
+    def test_new_sub_account_refreshes_parent_dashboard(self):
+        self.api.get(reverse('user-dashboard'))
+
+        User.objects.create_user(username='dash_new_sub', password='password', parent_account=self.client_user)
+
+        response = self.api.get(reverse('user-dashboard'))
+        self.assertEqual([sub['username'] for sub in response.data['sub_accounts']], ['dash_new_sub'])
@@ -0,0 +1,42 @@
+from django.test import TestCase
+
+from core_auth.models import User
+from core_auth.serializers import CustomTokenObtainPairSerializer
+
+
+class UserFullNameTests(TestCase):
+    def test_full_name_follows_name_fields(self):
+        user = User.objects.create_user(username='asha', first_name='Asha', last_name='Mehta')
+        self.assertEqual(user.full_name, 'Asha Mehta')
+
+        user.last_name = 'Rao'
+        user.save(update_fields=['last_name'])
+        user.refresh_from_db()
+        self.assertEqual(user.full_name, 'Asha Rao')
+
+    def test_full_name_falls_back_to_username(self):
+        user = User.objects.create_user(username='nameless')
+
+        self.assertEqual(user.full_name, 'nameless')
+
+    def test_token_claim_uses_stored_full_name(self):
+        user = User.objects.create_user(username='asha', first_name='Asha', last_name='Mehta')
+
+        token = CustomTokenObtainPairSerializer.get_token(user)
+
+        self.assertEqual(token['full_name'], 'Asha Mehta')
+
+    def test_full_name_fits_maximum_length_names(self):
+        user = User.objects.create_user(username='longname', first_name='a' * 150, last_name='b' * 150)
+
+        user.refresh_from_db()
+        self.assertEqual(user.full_name, f"{'a' * 150} {'b' * 150}")
+
+    def test_bulk_update_rejects_name_fields(self):
+        user = User.objects.create_user(username='asha', first_name='Asha', last_name='Mehta')
+
+        with self.assertRaises(ValueError):
+            User.objects.filter(pk=user.pk).update(first_name='Priya')
+
+        user.refresh_from_db()
+        self.assertEqual(user.full_name, 'Asha Mehta')
@@ -0,0 +1,218 @@
+import json
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core_auth.services import whatsapp_otp
+from core_auth.services.whatsapp_otp import (
+    MAX_RESENDS_PER_HOUR,
+    MAX_VERIFY_ATTEMPTS,
+    can_resend_otp,
+    generate_otp,
+    get_stored_otp,
+    send_whatsapp_otp,
+    store_otp,
+    verify_otp,
+)
+from core_auth.models import User
+from core_auth.tasks import send_otp_task
+
+
+class WhatsAppOTPServiceTests(SimpleTestCase):
+    phone = '+919876543210'
+
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_generate_otp_is_zero_padded_six_digits(self):
+        for _ in range(50):
+            otp = generate_otp()
+            self.assertEqual(len(otp), 6)
+            self.assertTrue(otp.isdigit())
+
+    def test_store_then_verify_clears_all_keys(self):
+        store_otp(self.phone, '123456')
+
+        success, _message, remaining = verify_otp(self.phone, '123456')
+
+        self.assertTrue(success)
+        self.assertEqual(remaining, MAX_VERIFY_ATTEMPTS)
+        self.assertEqual(cache.get_many([
+            whatsapp_otp._otp_key(self.phone),
+            whatsapp_otp._attempts_key(self.phone),
+            whatsapp_otp._resend_cooldown_key(self.phone),
+            whatsapp_otp._resend_count_key(self.phone),
+        ]), {})
+
+    def test_leading_zero_otp_round_trips(self):
+        store_otp(self.phone, '004321')
+
+        self.assertEqual(cache.get(whatsapp_otp._otp_key(self.phone)), 4321)
+        success, _message, _remaining = verify_otp(self.phone, '004321')
+        self.assertTrue(success)
+
+    def test_wrong_otp_counts_down_then_locks(self):
+        store_otp(self.phone, '123456')
+
+        for expected_remaining in range(MAX_VERIFY_ATTEMPTS - 1, 0, -1):
+            success, _message, remaining = verify_otp(self.phone, '000000')
+            self.assertFalse(success)
+            self.assertEqual(remaining, expected_remaining)
+
+        success, _message, remaining = verify_otp(self.phone, '000000')
+        self.assertFalse(success)
+        self.assertEqual(remaining, 0)
+
+        # The OTP is discarded once locked, even the correct code fails
+        success, message, _remaining = verify_otp(self.phone, '123456')
+        self.assertFalse(success)
+        self.assertIn('expired', message)
+
+    def test_non_ascii_digits_are_a_wrong_guess(self):
+        store_otp(self.phone, '123456')
+
+        success, _message, remaining = verify_otp(self.phone, '\u0661\u0662\u0663\u0664\u0665\u0666')
+
+        self.assertFalse(success)
+        self.assertEqual(remaining, MAX_VERIFY_ATTEMPTS - 1)
+
+    def test_parallel_wrong_guesses_still_lock(self):
+        store_otp(self.phone, '123456')
+        # Every request reads the counter before any of them writes it back
+        snapshot = cache.get_many([whatsapp_otp._otp_key(self.phone), whatsapp_otp._attempts_key(self.phone)])
+
+        with patch.object(whatsapp_otp.cache, 'get_many', return_value=snapshot):
+            results = [verify_otp(self.phone, '000000') for _ in range(MAX_VERIFY_ATTEMPTS)]
+
+        self.assertEqual([remaining for _success, _message, remaining in results], [4, 3, 2, 1, 0])
+        self.assertIsNone(cache.get(whatsapp_otp._otp_key(self.phone)))
+
+    def test_resend_blocked_during_cooldown(self):
+        store_otp(self.phone, '123456')
+
+        can_send, _reason, wait_seconds = can_resend_otp(self.phone)
+
+        self.assertFalse(can_send)
+        self.assertGreater(wait_seconds, 0)
+
+    def test_resend_blocked_after_hourly_limit(self):
+        for _ in range(MAX_RESENDS_PER_HOUR):
+            store_otp(self.phone, '123456')
+        cache.delete(whatsapp_otp._resend_cooldown_key(self.phone))
+
+        can_send, reason, _wait_seconds = can_resend_otp(self.phone)
+
+        self.assertFalse(can_send)
+        self.assertIn('Too many', reason)
+
+    @override_settings(META_PHONE_NUMBER_ID='12345', META_ACCESS_TOKEN='token', META_API_VERSION='v21.0')
+    def test_send_uses_shared_session(self):
+        with patch.object(whatsapp_otp._META_SESSION, 'post') as mock_post:
+            mock_post.return_value.status_code = 200
+            mock_post.return_value.json.return_value = {'messages': [{'id': 'wamid.1'}]}
+
+            success, _message = send_whatsapp_otp('919876543210', '123456')
+
+        self.assertTrue(success)
+        url = mock_post.call_args.args[0]
+        self.assertEqual(url, 'https://graph.facebook.com/v21.0/12345/messages')
+        self.assertEqual(mock_post.call_args.kwargs['headers']['Authorization'], 'Bearer token')
+
+        payload = json.loads(mock_post.call_args.kwargs['data'])
+        self.assertEqual(payload['to'], '919876543210')
+        self.assertEqual(payload['template']['name'], 'otp_authentication')
+        for component in payload['template']['components']:
+            self.assertEqual(component['parameters'][0]['text'], '123456')
+
+    @override_settings(META_PHONE_NUMBER_ID='12345', META_ACCESS_TOKEN='token', META_API_VERSION='v21.0')
+    def test_send_rejects_non_numeric_input(self):
+        with patch.object(whatsapp_otp._META_SESSION, 'post') as mock_post:
+            success, _message = send_whatsapp_otp('91987"6543210', '123456')
+
+        self.assertFalse(success)
+        mock_post.assert_not_called()
+
+
+class SendOTPViewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='otp_sender',
+            email='otp-sender@example.com',
+            password='password',
+            role=User.CLIENT,
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def tearDown(self):
+        cache.clear()
+
+    @patch('core_auth.tasks.send_whatsapp_otp', return_value=(True, 'OTP sent successfully'))
+    def test_send_runs_task_and_records_status(self, mock_send):
+        response = self.client.post(reverse('send-otp'), {'phone_number': '9876543210'}, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['status'], 'sent')
+        self.assertEqual(mock_send.call_args.args[0], '+919876543210')
+
+        status_response = self.client.get(reverse('send-otp-status'), {'phone_number': '9876543210'})
+        self.assertEqual(status_response.status_code, 200)
+        self.assertEqual(status_response.data['status'], 'sent')
+
+    @patch('core_auth.tasks.send_whatsapp_otp', return_value=(False, 'Too many messages sent.'))
+    def test_send_failure_returns_bad_gateway(self, _mock_send):
+        response = self.client.post(reverse('send-otp'), {'phone_number': '9876543210'}, format='json')
+
+        self.assertEqual(response.status_code, 502)
+        self.assertEqual(response.data['error'], 'Too many messages sent.')
+
+    @patch('core_auth.tasks.send_whatsapp_otp', return_value=(True, 'OTP sent successfully'))
+    def test_task_reads_otp_from_cache_not_arguments(self, mock_send):
+        with patch('core_auth.views.send_otp_task', wraps=send_otp_task) as mock_task:
+            self.client.post(reverse('send-otp'), {'phone_number': '9876543210'}, format='json')
+
+        self.assertEqual(mock_task.enqueue.call_args.args, (self.user.id, '+919876543210'))
+        self.assertEqual(mock_send.call_args.args, ('+919876543210', get_stored_otp('+919876543210')))
+
+    @patch('core_auth.tasks.send_whatsapp_otp', return_value=(True, 'OTP sent successfully'))
+    def test_status_is_only_visible_to_the_sender(self, _mock_send):
+        self.client.post(reverse('send-otp'), {'phone_number': '9876543210'}, format='json')
+        other = APIClient()
+        other.force_authenticate(user=User.objects.create_user(username='otp_snoop', password='password'))
+
+        response = other.get(reverse('send-otp-status'), {'phone_number': '9876543210'})
+
+        self.assertEqual(response.status_code, 404)
+
+    @patch('core_auth.tasks.send_whatsapp_otp', return_value=(True, 'OTP sent successfully'))
+    def test_country_code_and_separators_are_normalized(self, mock_send):
+        response = self.client.post(reverse('send-otp'), {'phone_number': '+91 98765-43210'}, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(mock_send.call_args.args[0], '+919876543210')
+
+    def test_invalid_numbers_are_rejected(self):
+        for phone_number, error in [
+            ('98765', 'Please enter a valid 10-digit Indian mobile number.'),
+            ('5876543210', 'Please enter a valid Indian mobile number starting with 6-9.'),
+        ]:
+            response = self.client.post(reverse('send-otp'), {'phone_number': phone_number}, format='json')
+
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.data['error'], error)
+
+    def test_number_verified_on_another_account_is_rejected(self):
+        User.objects.create_user(
+            username='otp_owner', password='password', phone_number='+919876543210', is_phone_verified=True,
+        )
+
+        response = self.client.post(reverse('send-otp'), {'phone_number': '9876543210'}, format='json')
+
+        self.assertEqual(response.status_code, 409)
@@ -1,6 +1,6 @@
 from django.urls import path
 from core_auth.views import (
-    SendOTPView, VerifyOTPView,
+    SendOTPView, SendOTPStatusView, VerifyOTPView,
     CustomTokenObtainPairView, UserDashboardView, GoogleAuthView,
     ClientProfileView, LogoutView, ConsultantClientsView,
     CustomTokenRefreshView, WebSocketTokenView, ContactSubmissionView,
@@ -29,6 +29,7 @@ urlpatterns = [
     path('auth/token/refresh/', CustomTokenRefreshView.as_view(), name='token_refresh'),
     path('auth/token/websocket/', WebSocketTokenView.as_view(), name='websocket_token'),
     path('auth/send-otp/', SendOTPView.as_view(), name='send-otp'),
+    path('auth/send-otp/status/', SendOTPStatusView.as_view(), name='send-otp-status'),
     path('auth/verify-otp/', VerifyOTPView.as_view(), name='verify-otp'),
     path('auth/dashboard/', UserDashboardView.as_view(), name='user-dashboard'),
     path('auth/profile/', onboarding_auth.get_user_profile, name='user-profile'),  # onboarding profile with step flags
@@ -1,7 +1,49 @@
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 
 User = get_user_model()
 
+# ConsultantClientsView responses, dropped by the core_auth.signals handlers
+# whenever a service request, client profile or client name changes.
+CONSULTANT_CLIENTS_CACHE_TTL_SECONDS = 300
+
+
+def consultant_clients_cache_key(consultant_user_id):
+    return f"consultant_clients:{consultant_user_id}"
+
+
+def invalidate_consultant_clients(consultant_user_ids):
+    keys = [consultant_clients_cache_key(uid) for uid in set(consultant_user_ids) if uid]
+    if keys:
+        cache.delete_many(keys)
+
+
+def invalidate_consultant_clients_for_client(client_user_id):
+    """Drop the cached client list of every consultant serving this client."""
+    from consultants.models import ClientServiceRequest
+
+    invalidate_consultant_clients(
+        ClientServiceRequest.objects.filter(
+            client_id=client_user_id,
+            assigned_consultant__isnull=False,
+        ).values_list('assigned_consultant__user_id', flat=True)
+    )
+
+
+# UserDashboardView payloads for a user viewing their own account; dropped
+# by core_auth.signals when the user, their profile or services change.
+DASHBOARD_CACHE_TTL_SECONDS = 30
+
+
+def dashboard_cache_key(user_id):
+    return f"dash:{user_id}"
+
+
+def invalidate_dashboards(user_ids):
+    keys = [dashboard_cache_key(uid) for uid in set(user_ids) if uid]
+    if keys:
+        cache.delete_many(keys)
+
 
 def _coerce_real_user(candidate):
     if isinstance(candidate, User):
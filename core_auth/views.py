@@ -7,15 +7,27 @@ from rest_framework import status
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework_simplejwt.views import TokenObtainPairView
 from rest_framework_simplejwt.tokens import RefreshToken
-from core_auth.serializers import IsConsultantUser, IsClientUser
+from rest_framework_simplejwt.utils import aware_utcnow
+from core_auth.authentication import CookieJWTAuthentication, refresh_token_cache
+from core_auth.serializers import IsConsultantUser, IsClientUser, mint_auth_tokens
 from core_auth.models import User, ClientProfile, MagicLinkToken
 from core_auth.services.whatsapp_otp import (
-    generate_otp, store_otp, send_whatsapp_otp,
+    generate_otp, store_otp,
     verify_otp as verify_otp_service, can_resend_otp,
-    RESEND_COOLDOWN_SECONDS, OTP_EXPIRY_SECONDS
+    get_otp_send_status, set_otp_send_status,
+    RESEND_COOLDOWN_SECONDS, OTP_EXPIRY_SECONDS,
+    OTP_SEND_PENDING, OTP_SEND_SENT, OTP_SEND_FAILED,
+)
+from core_auth.services.google_auth import fetch_google_userinfo, verify_google_id_token
+from core_auth.tasks import send_otp_task
+from core_auth.utils import (
+    CONSULTANT_CLIENTS_CACHE_TTL_SECONDS, DASHBOARD_CACHE_TTL_SECONDS,
+    consultant_clients_cache_key, dashboard_cache_key,
 )
 
 from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
 from django.http import HttpResponse
 from django.urls import reverse
 from django.utils.decorators import method_decorator
@@ -25,6 +37,13 @@ import requests
 MAGIC_LINK_EXPIRY_MINUTES=15
 logger = logging.getLogger(__name__)
 
+_NON_DIGIT_RE = re.compile(r'\D')
+
+# Fixed flags for the JWT cookies; secure/samesite/domain come from
+# _get_cookie_settings() since they depend on the request.
+_ACCESS_COOKIE_KW = {'httponly': True, 'max_age': 3600}  # 1 hour
+_REFRESH_COOKIE_KW = {'httponly': True, 'max_age': 86400 * 7}  # 7 days
+
 def _get_cookie_settings(request=None):
     """
     Resolve cookie flags for auth cookies.
@@ -50,41 +69,48 @@ def _get_cookie_settings(request=None):
     return secure, samesite, domain
 
 
-def set_auth_cookies(response, user, request=None):
-    """Helper to set HttpOnly JWT cookies for a user using settings-based configuration."""
-    refresh = RefreshToken.for_user(user)
-    
-    # Add custom claims to the access token
-    refresh['user_role'] = user.role
-    refresh['full_name'] = f"{user.first_name} {user.last_name}".strip() or user.username
-    refresh['is_phone_verified'] = user.is_phone_verified
-    
-    access_token = str(refresh.access_token)
-    refresh_token = str(refresh)
-    
+def _set_jwt_cookies(response, request, access_token, refresh_token=None):
+    """Set the access (and optionally refresh) JWT cookies on `response`."""
     secure, samesite, domain = _get_cookie_settings(request=request)
-    
-    response.set_cookie(
-        key='access_token',
-        value=access_token,
-        httponly=True,
-        secure=secure,
-        samesite=samesite,
-        domain=domain,
-        max_age=3600
-    )
-    response.set_cookie(
-        key='refresh_token',
-        value=refresh_token,
-        httponly=True,
-        secure=secure,
-        samesite=samesite,
-        domain=domain,
-        max_age=86400 * 7 # 7 days
-    )
+    request_kw = {'secure': secure, 'samesite': samesite, 'domain': domain}
+    response.set_cookie('access_token', access_token, **_ACCESS_COOKIE_KW, **request_kw)
+    if refresh_token is not None:
+        response.set_cookie('refresh_token', refresh_token, **_REFRESH_COOKIE_KW, **request_kw)
     return response
 
 
+def set_auth_cookies(response, user, request=None):
+    """Helper to set HttpOnly JWT cookies for a user using settings-based configuration."""
+    access_token, refresh_token = mint_auth_tokens(user)
+    return _set_jwt_cookies(response, request, access_token, refresh_token)
+
+
+def _decode_refresh_token(raw_token):
+    """
+    Validate a refresh token cookie, reusing a decode from the last few
+    seconds. Only the decode is reused; expiry is checked on every call.
+    """
+    refresh = refresh_token_cache.get(raw_token)
+    if refresh is None:
+        refresh = RefreshToken(raw_token)
+        refresh_token_cache.set(raw_token, refresh)
+    else:
+        # check_exp() defaults to the time the token was decoded, so pass now
+        refresh.check_exp(current_time=aware_utcnow())
+    return refresh
+
+
+def _normalize_indian_mobile(phone_number):
+    """
+    Reduce +91XXXXXXXXXX, 91XXXXXXXXXX or XXXXXXXXXX (any separators) to the
+    10 local digits. Returns None if what remains is not 10 digits.
+    """
+    digits_only = _NON_DIGIT_RE.sub('', phone_number)
+    if len(digits_only) == 12 and digits_only.startswith('91'):
+        digits_only = digits_only[2:]  # strip country code
+    return digits_only if len(digits_only) == 10 else None
+
+
 def _sync_consultant_application(user, lookup_email=None, **updates):
     """Keep the consultant's onboarding application aligned with verified contact changes."""
     if user.role != User.CONSULTANT or not updates:
@@ -309,35 +335,27 @@ class SendOTPView(APIView):
         phone_number = request.data.get('phone_number', '').strip()
 
         # Validate: user should provide 10 digits (we add +91 prefix)
-        digits_only = re.sub(r'\D', '', phone_number)
-
-        # Handle cases where user sends +91XXXXXXXXXX or 91XXXXXXXXXX or just XXXXXXXXXX
-        if len(digits_only) == 12 and digits_only.startswith('91'):
-            digits_only = digits_only[2:]  # strip country code
-        elif len(digits_only) == 10:
-            pass  # already 10 digits
-        else:
+        digits_only = _normalize_indian_mobile(phone_number)
+        if digits_only is None:
             return Response(
                 {'error': 'Please enter a valid 10-digit Indian mobile number.'},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
         # Validate: Indian mobile numbers start with 6-9
-        if not re.match(r'^[6-9]\d{9}$', digits_only):
+        if digits_only[0] not in '6789':
             return Response(
                 {'error': 'Please enter a valid Indian mobile number starting with 6-9.'},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # Store as +91XXXXXXXXXX for internal use, 91XXXXXXXXXX for WhatsApp API
+        # Store as +91XXXXXXXXXX (send_whatsapp_otp drops the '+' for the API)
         full_phone = f'+91{digits_only}'
-        wa_phone = f'91{digits_only}'
 
         # Check if a different user already has this phone number verified
-        existing_user = User.objects.filter(
+        if User.objects.filter(
             phone_number=full_phone, is_phone_verified=True
-        ).exclude(id=request.user.id).first()
-        if existing_user:
+        ).exclude(id=request.user.id).exists():
             return Response(
                 {'error': 'This phone number is already registered with another account.'},
                 status=status.HTTP_409_CONFLICT
@@ -351,29 +369,59 @@ class SendOTPView(APIView):
                 status=status.HTTP_429_TOO_MANY_REQUESTS
             )
 
-        # Generate and store OTP
-        otp = generate_otp()
-        store_otp(full_phone, otp)
+        # Generate and store OTP; send_otp_task reads it back from the cache
+        store_otp(full_phone, generate_otp())
 
-        # Send via WhatsApp
-        success, message = send_whatsapp_otp(wa_phone, otp)
+        # Send via WhatsApp on the task backend. With a worker-backed queue
+        # this returns immediately and the client polls send-otp-status;
+        # the immediate backend has already finished by the time we read it.
+        set_otp_send_status(request.user.id, full_phone, OTP_SEND_PENDING)
+        send_otp_task.enqueue(request.user.id, full_phone)
+        send_status = get_otp_send_status(request.user.id, full_phone) or {'status': OTP_SEND_PENDING}
 
-        if success:
-            logger.info(f"OTP sent to {full_phone[-4:]} for user {request.user.id}")
-            return Response({
-                'success': True,
-                'message': 'OTP sent to your WhatsApp number.',
-                'cooldown': RESEND_COOLDOWN_SECONDS,
-                'expiry': OTP_EXPIRY_SECONDS,
-                'phone_display': f'+91 {digits_only[:5]} {digits_only[5:]}',
-            })
-        else:
-            logger.error(f"Failed to send OTP to {full_phone[-4:]}: {message}")
+        if send_status['status'] == OTP_SEND_FAILED:
+            logger.error(f"Failed to send OTP to {full_phone[-4:]}: {send_status['message']}")
             return Response(
-                {'error': message},
+                {'error': send_status['message']},
                 status=status.HTTP_502_BAD_GATEWAY
             )
 
+        sent = send_status['status'] == OTP_SEND_SENT
+        if sent:
+            logger.info(f"OTP sent to {full_phone[-4:]} for user {request.user.id}")
+        return Response({
+            'success': True,
+            'status': send_status['status'],
+            'message': 'OTP sent to your WhatsApp number.' if sent else 'Sending OTP to your WhatsApp number.',
+            'cooldown': RESEND_COOLDOWN_SECONDS,
+            'expiry': OTP_EXPIRY_SECONDS,
+            'phone_display': f'+91 {digits_only[:5]} {digits_only[5:]}',
+        }, status=status.HTTP_200_OK if sent else status.HTTP_202_ACCEPTED)
+
+
+class SendOTPStatusView(APIView):
+    """
+    Poll the WhatsApp delivery status of the last OTP the caller sent to a phone number.
+    GET /auth/send-otp/status/?phone_number=9876543210
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        digits_only = _normalize_indian_mobile(request.query_params.get('phone_number', ''))
+        if digits_only is None:
+            return Response(
+                {'error': 'Invalid phone number format.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        send_status = get_otp_send_status(request.user.id, f'+91{digits_only}')
+        if send_status is None:
+            return Response(
+                {'error': 'No OTP was sent to this number recently.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        return Response(send_status)
+
 
 class VerifyOTPView(APIView):
     """
@@ -399,10 +447,8 @@ class VerifyOTPView(APIView):
             )
 
         # Normalize phone number to +91XXXXXXXXXX
-        digits_only = re.sub(r'\D', '', phone_number)
-        if len(digits_only) == 12 and digits_only.startswith('91'):
-            digits_only = digits_only[2:]
-        if len(digits_only) != 10:
+        digits_only = _normalize_indian_mobile(phone_number)
+        if digits_only is None:
             return Response(
                 {'error': 'Invalid phone number format.'},
                 status=status.HTTP_400_BAD_REQUEST
@@ -445,28 +491,7 @@ class CustomTokenObtainPairView(TokenObtainPairView):
     def post(self, request, *args, **kwargs):
         response = super().post(request, *args, **kwargs)
         if response.status_code == 200:
-            access_token = response.data['access']
-            refresh_token = response.data['refresh']
-            secure, samesite, domain = _get_cookie_settings(request=request)
-            
-            response.set_cookie(
-                key='access_token',
-                value=access_token,
-                httponly=True,
-                secure=secure,
-                samesite=samesite,
-                domain=domain,
-                max_age=3600
-            )
-            response.set_cookie(
-                key='refresh_token',
-                value=refresh_token,
-                httponly=True,
-                secure=secure,
-                samesite=samesite,
-                domain=domain,
-                max_age=86400 * 7
-            )
+            _set_jwt_cookies(response, request, response.data['access'], response.data['refresh'])
         return response
 
 @method_decorator(csrf_exempt, name='dispatch')
@@ -496,42 +521,21 @@ class GoogleAuthView(APIView):
 
         try:
             if id_token:
-                # Verify ID token with Google
-                google_response = requests.get(
-                    f'https://oauth2.googleapis.com/tokeninfo?id_token={id_token}'
-                )
-                
-                if google_response.status_code != 200:
-                    return Response({'error': 'Invalid Google ID token'}, status=status.HTTP_401_UNAUTHORIZED)
-                
-                google_data = google_response.json()
-                
-                # Verify the token is for our app - accept multiple client IDs
-                # (main SaaS frontend + onboarding frontend may use different OAuth clients)
-                allowed_client_ids = [cid for cid in [
-                    settings.GOOGLE_CLIENT_ID,
-                    getattr(settings, 'GOOGLE_ONBOARDING_CLIENT_ID', None),
-                ] if cid]
-                token_aud = google_data.get('aud')
-                if token_aud not in allowed_client_ids:
-                    return Response({'error': 'Token not issued for this app'}, status=status.HTTP_401_UNAUTHORIZED)
-                
+                # Verify the ID token's signature against Google's (cached) certificates
+                google_data, error = verify_google_id_token(id_token)
+                if error:
+                    return Response({'error': error}, status=status.HTTP_401_UNAUTHORIZED)
+
                 email = google_data.get('email')
                 first_name = google_data.get('given_name', '')
                 last_name = google_data.get('family_name', '')
 
             elif access_token:
                 # Verify Access token by fetching user info
-                google_response = requests.get(
-                    'https://www.googleapis.com/oauth2/v3/userinfo',
-                    headers={'Authorization': f'Bearer {access_token}'}
-                )
+                google_data, error = fetch_google_userinfo(access_token)
+                if error:
+                    return Response({'error': error}, status=status.HTTP_401_UNAUTHORIZED)
 
-                if google_response.status_code != 200:
-                    return Response({'error': 'Invalid Google Access token'}, status=status.HTTP_401_UNAUTHORIZED)
-                
-                google_data = google_response.json()
-                
                 email = google_data.get('email')
                 first_name = google_data.get('given_name', '')
                 last_name = google_data.get('family_name', '')
@@ -541,20 +545,9 @@ class GoogleAuthView(APIView):
                 return Response({'error': 'Email not provided by Google'}, status=status.HTTP_400_BAD_REQUEST)
             
             # Find existing user or create a new client
-            try:
-                user = User.objects.get(email=email)
-                created = False
-                
-                # OPTION A ENFORCEMENT: Consultants cannot log in via Google
-                if user.role == User.CONSULTANT:
-                    return Response(
-                        {
-                            'error': 'Consultants must use their provided username   and password to log in.',
-                            'code': 'EMAIL_CONFLICT'
-                        }, 
-                        status=status.HTTP_403_FORBIDDEN
-                    )
-            except User.DoesNotExist:
+            user = User.objects.filter(email=email).first()
+            created = False
+            if user is None:
                 # OPTION A ENFORCEMENT (early detection): Before creating a new Client,
                 # check if this email is already used in the Consultant Onboarding portal.
                 # This prevents someone from registering as a Client with an email they 
@@ -575,27 +568,42 @@ class GoogleAuthView(APIView):
                     pass  # Non-critical — proceed if consultant_onboarding is unavailable
 
                 # New users signing up via Google on main app default to CLIENT
-                user = User.objects.create(
-                    email=email,
-                    username=email.split('@')[0],
-                    first_name=first_name,
-                    last_name=last_name,
-                    role=User.CLIENT,
-                    is_phone_verified=False,
-                    phone_number=None
+                try:
+                    with transaction.atomic():
+                        user = User.objects.create(
+                            email=email,
+                            username=email.split('@')[0],
+                            first_name=first_name,
+                            last_name=last_name,
+                            role=User.CLIENT,
+                            is_phone_verified=False,
+                            phone_number=None
+                        )
+                        ClientProfile.objects.create(user=user)
+                    created = True
+                except IntegrityError:
+                    # A concurrent login for the same Google account inserted the user
+                    # between our lookup and insert — use that row instead of failing.
+                    user = User.objects.filter(email=email).first()
+                    if user is None:
+                        raise
+
+            # OPTION A ENFORCEMENT: Consultants cannot log in via Google
+            if user.role == User.CONSULTANT:
+                return Response(
+                    {
+                        'error': 'Consultants must use their provided username   and password to log in.',
+                        'code': 'EMAIL_CONFLICT'
+                    }, 
+                    status=status.HTTP_403_FORBIDDEN
                 )
-                created = True
-            
-            # Create ClientProfile if it's a new client
-            if created and user.role == User.CLIENT:
-                ClientProfile.objects.create(user=user)
 
             # Create response with user data
             response_data = {
                 'success': True,
                 'created': created,
                 'role': user.role,
-                'full_name': f"{user.first_name} {user.last_name}".strip() or user.username,
+                'full_name': user.full_name,
             }
             
             response = Response(response_data)
@@ -616,9 +624,8 @@ class LogoutView(APIView):
     permission_classes = [AllowAny]
     
     def post(self, request):
-        jwt_conf = getattr(settings, 'SIMPLE_JWT', {})
-        samesite = jwt_conf.get('AUTH_COOKIE_SAMESITE', 'Lax')
-        domain = jwt_conf.get('AUTH_COOKIE_DOMAIN', None)
+        # Clear with the same flags the cookies were set with
+        _secure, samesite, domain = _get_cookie_settings(request=request)
         
         response = Response({'success': True, 'message': 'Logged out successfully'})
         response.delete_cookie('access_token', samesite=samesite, domain=domain)
@@ -644,8 +651,8 @@ class CustomTokenRefreshView(APIView):
             )
         
         try:
-            # Validate and decode the refresh token
-            refresh = RefreshToken(refresh_token)
+            # Validate and decode the refresh token (reused briefly across tabs)
+            refresh = _decode_refresh_token(refresh_token)
             
             # Rotation logic if enabled
             jwt_conf = getattr(settings, 'SIMPLE_JWT', {})
@@ -657,42 +664,19 @@ class CustomTokenRefreshView(APIView):
                 'message': 'Token refreshed successfully'
             })
             
-            # Set new access token as HttpOnly cookie
-            samesite = jwt_conf.get('AUTH_COOKIE_SAMESITE', 'Lax')
-            secure = jwt_conf.get('AUTH_COOKIE_SECURE', True)
-            domain = jwt_conf.get('AUTH_COOKIE_DOMAIN', None)
-            
-            response.set_cookie(
-                key='access_token',
-                value=str(refresh.access_token),
-                httponly=True,
-                secure=secure,
-                samesite=samesite,
-                domain=domain,
-                max_age=3600  # 1 hour
-            )
-            
             # Handle Refresh Token Rotation
             if rotate_refresh:
-                # Blacklist the old one if BLACKLIST_AFTER_ROTATION is true
-                # simple_jwt handles the blacklist if we use its TokenRefreshView,
-                # here we need to manually rotate if we want to follow the settings.
-                new_refresh = str(refresh) # RefreshToken(str(refresh)) might be needed for rotation if settings applied
-                # Actually str(refresh) will give the SAME token unless blacklist enabled?
-                # Let's just issue a COMPLETELY new one for the user to be sure
-                new_token = RefreshToken.for_user(User.objects.get(id=refresh.payload.get('user_id')))
-                
-                response.set_cookie(
-                    key='refresh_token',
-                    value=str(new_token),
-                    httponly=True,
-                    secure=secure,
-                    samesite=samesite,
-                    domain=domain,
-                    max_age=86400 * 7
-                )
-            
-            return response
+                # str(refresh) would give the SAME token unless blacklist is enabled,
+                # so issue a COMPLETELY new pair for the user. The user comes from the
+                # shared auth cache, and mint_auth_tokens embeds the same custom claims
+                # as login.
+                user = CookieJWTAuthentication().get_user(refresh)
+                access_token, new_refresh = mint_auth_tokens(user)
+            else:
+                access_token, new_refresh = str(refresh.access_token), None
+
+            # Set new access token (and rotated refresh token) as HttpOnly cookies
+            return _set_jwt_cookies(response, request, access_token, new_refresh)
             
         except Exception as e:
             logger.error(f"Refresh Token Error: {str(e)}")
@@ -726,12 +710,9 @@ class VerifySessionView(APIView):
             )
 
         try:
-            from rest_framework_simplejwt.authentication import JWTAuthentication
-            from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
-
-            jwt_authenticator = JWTAuthentication()
+            jwt_authenticator = CookieJWTAuthentication()
             # Cryptographic signature verification — fast, no DB required
-            validated_token = jwt_authenticator.get_validated_token(access_token)
+            validated_token = jwt_authenticator.get_cached_validated_token(access_token)
             payload = validated_token.payload
 
             # Read custom claims embedded at login by set_auth_cookies()
@@ -741,11 +722,12 @@ class VerifySessionView(APIView):
             user_id = payload.get('user_id')
             email = payload.get('email')
 
-            # If any critical claim is missing, do a single targeted DB fetch
+            # If any critical claim is missing, load the user (served from
+            # the auth user cache, so normally no DB fetch either)
             if not user_role or email is None:
                 user = jwt_authenticator.get_user(validated_token)
                 user_role = user.role
-                full_name = f"{user.first_name} {user.last_name}".strip() or user.username
+                full_name = user.full_name
                 is_phone_verified = user.is_phone_verified
                 user_id = user.id
                 email = user.email
@@ -780,24 +762,32 @@ class UserDashboardView(APIView):
         active_user = get_active_profile(request)
         if not isinstance(active_user, User):
             active_user = auth_user
-        
+
+        # Only a user's view of their own account is cached; switching to a
+        # sub-account profile is rare and always computed fresh.
+        if active_user.id != auth_user.id:
+            return Response(self._build_dashboard(auth_user, active_user))
+
+        data = cache.get_or_set(
+            dashboard_cache_key(auth_user.id),
+            lambda: self._build_dashboard(auth_user, active_user),
+            DASHBOARD_CACHE_TTL_SECONDS,
+        )
+        return Response(data)
+
+    def _build_dashboard(self, auth_user, active_user):
         # Always use the main account (parent) to list sub-accounts
-        main_user = auth_user.parent_account if auth_user.parent_account else auth_user
+        main_user_id = auth_user.parent_account_id or auth_user.id
         
-        sub_accounts_data = [
-            {
-                "id": sub.id,
-                "first_name": sub.first_name,
-                "last_name": sub.last_name,
-                "username": sub.username
-            } for sub in main_user.sub_accounts.all()
-        ]
+        sub_accounts_data = list(
+            User.objects.filter(parent_account_id=main_user_id).values("id", "first_name", "last_name", "username")
+        )
         
         data = {
             "id": auth_user.id,
             "first_name": auth_user.first_name,
             "last_name": auth_user.last_name,
-            "full_name": f"{auth_user.first_name} {auth_user.last_name}".strip() or auth_user.username,
+            "full_name": auth_user.full_name,
             "username": auth_user.username,
             "email": auth_user.email,
             "phone": auth_user.phone_number,
@@ -809,7 +799,7 @@ class UserDashboardView(APIView):
                 "id": active_user.id,
                 "first_name": active_user.first_name,
                 "last_name": active_user.last_name,
-                "full_name": f"{active_user.first_name} {active_user.last_name}".strip() or active_user.username,
+                "full_name": active_user.full_name,
                 "username": active_user.username,
                 "role": active_user.role,
                 "is_sub_account": active_user.id != auth_user.id,
@@ -861,28 +851,20 @@ class UserDashboardView(APIView):
                 data["pan"] = profile.pan_number
                 data["gst"] = profile.gstin
                 
-                from consultants.utils import get_active_consultant_for_client
-                advisor = get_active_consultant_for_client(user)
+                # The active request query already joins the consultant's
+                # service profile and user, so no follow-up lookups are needed.
+                from consultants.utils import get_active_consultant_profile_for_client
+                service_profile = get_active_consultant_profile_for_client(auth_user)
                 advisor_data = None
                 
-                if advisor:
-                    from consultants.models import ConsultantServiceProfile
-                    try:
-                        service_profile = advisor.consultant_service_profile
-                        advisor_data = {
-                            "name": service_profile.full_name,
-                            "email": service_profile.email,
-                            "phone": service_profile.phone,
-                            "qualification": service_profile.qualification,
-                            "avatar": "" # Placeholder
-                        }
-                    except Exception:
-                        advisor_data = {
-                            "name": advisor.get_full_name() or advisor.username,
-                            "email": advisor.email,
-                            "phone": advisor.phone_number,
-                            "avatar": ""
-                        }
+                if service_profile:
+                    advisor_data = {
+                        "name": service_profile.full_name,
+                        "email": service_profile.email,
+                        "phone": service_profile.phone,
+                        "qualification": service_profile.qualification,
+                        "avatar": "" # Placeholder
+                    }
                 
                 data["advisor"] = advisor_data
                 data["compliance"] = {
@@ -893,7 +875,7 @@ class UserDashboardView(APIView):
                 data["advisor"] = None
                 data["compliance"] = None
         
-        return Response(data)
+        return data
 
 
 class ActivateProfileView(APIView):
@@ -925,7 +907,7 @@ class ActivateProfileView(APIView):
                 'id': profile_user.id,
                 'first_name': profile_user.first_name,
                 'last_name': profile_user.last_name,
-                'full_name': f"{profile_user.first_name} {profile_user.last_name}".strip() or profile_user.username,
+                'full_name': profile_user.full_name,
                 'username': profile_user.username,
                 'is_sub_account': is_own_subaccount,
             }
@@ -975,7 +957,7 @@ class WebSocketTokenView(APIView):
         refresh_token = request.COOKIES.get('refresh_token')
         if refresh_token:
             try:
-                refresh = RefreshToken(refresh_token)
+                refresh = _decode_refresh_token(refresh_token)
                 access_token = str(refresh.access_token)
                 return Response({'token': access_token})
             except Exception:
@@ -993,6 +975,8 @@ class ClientProfileView(APIView):
     Each client can only access their own profile (data isolation).
     """
     permission_classes = [IsAuthenticated]
+    USER_FIELDS = ('first_name', 'last_name', 'phone_number', 'is_phone_verified')
+    PROFILE_FIELDS = ('pan_number',)
 
     def get(self, request):
         """Get current client's profile data."""
@@ -1026,26 +1010,30 @@ class ClientProfileView(APIView):
         
         try:
             profile = user.client_profile
-            
+            data = request.data
+            user_updates = {k: data[k] for k in self.USER_FIELDS if k in data}
+            profile_updates = {k: data[k] for k in self.PROFILE_FIELDS if k in data}
+
             # Update user fields
-            if 'first_name' in request.data:
-                user.first_name = request.data['first_name']
-            if 'last_name' in request.data:
-                user.last_name = request.data['last_name']
-            if 'phone_number' in request.data:
-                user.phone_number = request.data['phone_number']
-            if 'is_phone_verified' in request.data:
-                user.is_phone_verified = request.data['is_phone_verified']
-                # If phone is verified and they are a client, they are mostly onboarded
-                if user.is_phone_verified:
-                    user.is_onboarded = True
-            
+            for field, value in user_updates.items():
+                setattr(user, field, value)
+            changed_user_fields = set(user_updates)
+            # If phone is verified and they are a client, they are mostly onboarded
+            if user_updates.get('is_phone_verified'):
+                user.is_onboarded = True
+                changed_user_fields.add('is_onboarded')
+
             # Update profile fields
-            if 'pan_number' in request.data:
-                profile.pan_number = request.data['pan_number']
-            
-            user.save()
-            profile.save()
+            for field, value in profile_updates.items():
+                setattr(profile, field, value)
+            changed_profile_fields = set(profile_updates)
+
+            # Only write the columns that were sent, committed together
+            with transaction.atomic():
+                if changed_user_fields:
+                    user.save(update_fields=list(changed_user_fields))
+                if changed_profile_fields:
+                    profile.save(update_fields=list(changed_profile_fields))
             
             return Response({
                 'success': True,
@@ -1071,70 +1059,66 @@ class ConsultantClientsView(APIView):
         # Only consultants can access this endpoint
         if user.role != User.CONSULTANT:
             return Response({'error': 'Only consultants can access this endpoint'}, status=status.HTTP_403_FORBIDDEN)
-        
-        # Get clients assigned via ClientServiceRequest (active services only)
+
+        clients_data = cache.get_or_set(
+            consultant_clients_cache_key(user.id),
+            lambda: self._build_clients_data(user),
+            CONSULTANT_CLIENTS_CACHE_TTL_SECONDS,
+        )
+        return Response(clients_data)
+
+    def _build_clients_data(self, user):
+        # One pass over this consultant's non-cancelled requests gives the
+        # active services per client and the earnings from completed ones.
         from consultants.models import ClientServiceRequest
-        service_clients = ClientServiceRequest.objects.filter(
-            assigned_consultant__user=user
-        ).exclude(status__in=['completed', 'cancelled']).values_list('client_id', flat=True)
-        
-        # Unique client IDs
-        client_ids = set(service_clients)
-        
-        # Fetch profiles with user data
-        assigned_clients = ClientProfile.objects.filter(user_id__in=client_ids).select_related('user')
-        
-        # Get all active service requests for these clients assigned to this consultant
-        active_requests = ClientServiceRequest.objects.filter(
-            client_id__in=client_ids,
+        status_labels = dict(ClientServiceRequest.STATUS_CHOICES)
+        consultant_requests = ClientServiceRequest.objects.filter(
             assigned_consultant__user=user
-        ).exclude(status__in=['completed', 'cancelled']).select_related('service')
+        ).exclude(status='cancelled').values(
+            'id', 'client_id', 'status', 'service__title', 'service__price',
+        )
 
-        # Map requests to clients
         client_requests_map = {}
-        for req in active_requests:
-            if req.client_id not in client_requests_map:
-                client_requests_map[req.client_id] = []
-            client_requests_map[req.client_id].append({
-                'id': req.id,
-                'service_title': req.service.title if req.service else 'Unknown Service',
-                'status': req.status,
-                'status_display': req.get_status_display()
+        client_earnings_map = {}
+        for req in consultant_requests:
+            client_id = req['client_id']
+            if req['status'] == 'completed':
+                client_earnings_map[client_id] = client_earnings_map.get(client_id, 0) + float(req['service__price'] or 0)
+                continue
+            client_requests_map.setdefault(client_id, []).append({
+                'id': req['id'],
+                'service_title': req['service__title'] if req['service__title'] is not None else 'Unknown Service',
+                'status': req['status'],
+                'status_display': status_labels.get(req['status'], req['status']),
             })
 
-        # Get completed requests for earnings calculation
-        completed_requests = ClientServiceRequest.objects.filter(
-            client_id__in=client_ids,
-            assigned_consultant__user=user,
-            status='completed'
-        ).select_related('service')
+        # Clients with at least one active service
+        assigned_clients = ClientProfile.objects.filter(
+            user_id__in=list(client_requests_map)
+        ).values(
+            'pan_number', 'gstin', 'gst_username',
+            'user_id', 'user__full_name', 'user__email', 'user__is_onboarded', 'user__date_joined',
+        )
 
-        # Map earnings to clients
-        client_earnings_map = {}
-        for req in completed_requests:
-            price = (req.service.price or 0) if req.service else 0
-            client_earnings_map[req.client_id] = client_earnings_map.get(req.client_id, 0) + float(price)
-
-        clients_data = []
-        for profile in assigned_clients:
-            client_user = profile.user
-            clients_data.append({
-                'id': client_user.id,
-                'name': f"{client_user.first_name} {client_user.last_name}".strip() or client_user.username,
-                'email': client_user.email,
-                'pan': profile.pan_number,
-                'gstin': profile.gstin,
-                'gst_username': profile.gst_username,
-                'status': 'active' if client_user.is_onboarded else 'pending',
-                'active_requests': client_requests_map.get(client_user.id, []),
-                'earnings': client_earnings_map.get(client_user.id, 0),
+        clients_data = [
+            {
+                'id': profile['user_id'],
+                'name': profile['user__full_name'],
+                'email': profile['user__email'],
+                'pan': profile['pan_number'],
+                'gstin': profile['gstin'],
+                'gst_username': profile['gst_username'],
+                'status': 'active' if profile['user__is_onboarded'] else 'pending',
+                'active_requests': client_requests_map.get(profile['user_id'], []),
+                'earnings': client_earnings_map.get(profile['user_id'], 0),
                 'avatarUrl': '',
-                'createdAt': client_user.date_joined.isoformat() if client_user.date_joined else None,
+                'createdAt': profile['user__date_joined'].isoformat() if profile['user__date_joined'] else None,
                 'consultantId': user.id,
                 'lastActivity': None,
-            })
-        
-        return Response(clients_data)
+            }
+            for profile in assigned_clients
+        ]
+        return clients_data
 
 
 from rest_framework.generics import CreateAPIView
@@ -1467,7 +1451,7 @@ class ClientRegisterView(APIView):
             'success': True,
             'created': True,
             'role': user.role,
-            'full_name': f"{user.first_name} {user.last_name}".strip() or user.username,
+            'full_name': user.full_name,
         }, status=status.HTTP_201_CREATED)
         return set_auth_cookies(response, user)
 
@@ -1528,7 +1512,7 @@ class ClientEmailLoginView(APIView):
         response = Response({
             'success': True,
             'role': user.role,
-            'full_name': f"{user.first_name} {user.last_name}".strip() or user.username,
+            'full_name': user.full_name,
             'is_phone_verified': user.is_phone_verified,
         })
         return set_auth_cookies(response, authenticated_user)
@@ -1689,7 +1673,7 @@ class VerifyMagicLinkView(APIView):
         response = Response({
             'success': True,
             'role': user.role,
-            'full_name': f"{user.first_name} {user.last_name}".strip() or user.username,
+            'full_name': user.full_name,
             'is_phone_verified': user.is_phone_verified,
         })
         return set_auth_cookies(response, user)
@@ -0,0 +1,23 @@
+# Generated by Django 6.0.1 on 2026-10-17 01:51
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('document_vault', '0009_rename_vault_docum_documen_910da8_idx_vault_docum_documen_4a25fd_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='document',
+            index=models.Index(fields=['client', 'status'], name='document_va_client__ca44c9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='document',
+            index=models.Index(fields=['client', '-created_at'], name='document_va_client__ef1e98_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 6.0.1 on 2026-10-17 02:02
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('document_vault', '0010_document_document_va_client__ca44c9_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='legalnotice',
+            index=models.Index(fields=['client', '-created_at'], name='document_va_client__502400_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sharedreport',
+            index=models.Index(fields=['client', '-created_at'], name='document_va_client__f1d637_idx'),
+        ),
+    ]
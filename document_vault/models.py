@@ -1,16 +1,46 @@
+from contextvars import ContextVar
+
 from django.db import models
 from django.conf import settings
-import os
 import uuid
 
+# (model, pk) pairs whose files a VaultFileQuerySet.delete() has already queued
+_bulk_file_deletes = ContextVar('vault_bulk_file_deletes', default=frozenset())
+
+
+def file_delete_queued_by_bulk_delete(instance):
+    return (instance._meta.concrete_model, instance.pk) in _bulk_file_deletes.get()
+
+
+class VaultFileQuerySet(models.QuerySet):
+    def delete(self):
+        """
+        Queue the storage delete for every file in the queryset as a single
+        task once the transaction commits. The per-row post_delete handlers in
+        document_vault.signals skip the rows queued here.
+        """
+        from .tasks import queue_storage_file_deletes
+
+        rows = list(self.values_list('pk', 'file'))
+        model = self.model._meta.concrete_model
+        token = _bulk_file_deletes.set(_bulk_file_deletes.get() | {(model, pk) for pk, _name in rows})
+        try:
+            deleted = super().delete()
+        finally:
+            _bulk_file_deletes.reset(token)
+        queue_storage_file_deletes([name for _pk, name in rows if name])
+        return deleted
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
+
 def document_file_path(instance, filename):
     """
     Generate a unique file path for uploaded documents.
     Format: vault/client_<id>/<uuid>_<filename>
     """
-    ext = filename.split('.')[-1]
-    filename = f"{uuid.uuid4()}_{filename}"
-    return os.path.join('vault', f'client_{instance.client.id}', filename)
+    return f"vault/client_{instance.client_id}/{uuid.uuid4().hex}_{filename}"
 
 class Folder(models.Model):
     """
@@ -76,11 +106,17 @@ class Document(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     uploaded_at = models.DateTimeField(null=True, blank=True)
 
+    objects = VaultFileQuerySet.as_manager()
+
     def __str__(self):
         return f"{self.title} - {self.client.username} ({self.status})"
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['client', 'status']),
+            models.Index(fields=['client', '-created_at']),
+        ]
 
 
 def shared_report_file_path(instance, filename):
@@ -88,8 +124,7 @@ def shared_report_file_path(instance, filename):
     Generate a unique file path for shared reports.
     Format: reports/client_<id>/<uuid>_<filename>
     """
-    filename = f"{uuid.uuid4()}_{filename}"
-    return os.path.join('reports', f'client_{instance.client.id}', filename)
+    return f"reports/client_{instance.client_id}/{uuid.uuid4().hex}_{filename}"
 
 
 class SharedReport(models.Model):
@@ -122,11 +157,16 @@ class SharedReport(models.Model):
     
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = VaultFileQuerySet.as_manager()
+
     def __str__(self):
         return f"{self.title} - Shared with {self.client.username}"
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['client', '-created_at']),
+        ]
 
 
 def legal_notice_file_path(instance, filename):
@@ -134,8 +174,7 @@ def legal_notice_file_path(instance, filename):
     Generate a unique file path for legal notices.
     Format: notices/client_<id>/<uuid>_<filename>
     """
-    filename = f"{uuid.uuid4()}_{filename}"
-    return os.path.join('notices', f'client_{instance.client.id}', filename)
+    return f"notices/client_{instance.client_id}/{uuid.uuid4().hex}_{filename}"
 
 
 class LegalNotice(models.Model):
@@ -190,11 +229,16 @@ class LegalNotice(models.Model):
     is_resolved = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = VaultFileQuerySet.as_manager()
+
     def __str__(self):
         return f"{self.title} - {self.client.username} ({self.priority})"
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['client', '-created_at']),
+        ]
 
 
 class DocumentAccess(models.Model):
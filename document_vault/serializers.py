@@ -3,28 +3,20 @@ from django.db.utils import OperationalError, ProgrammingError
 from .models import Document, SharedReport, LegalNotice, Folder, DocumentAccess
 
 class FolderSerializer(serializers.ModelSerializer):
-    created_by_name = serializers.ReadOnlyField(source='created_by.get_full_name')
-    document_count = serializers.SerializerMethodField()
-    verified_count = serializers.SerializerMethodField()
-    unverified_count = serializers.SerializerMethodField()
+    created_by_name = serializers.ReadOnlyField(source='created_by.full_name')
+    # Annotated by FolderViewSet.get_queryset
+    document_count = serializers.IntegerField(read_only=True)
+    verified_count = serializers.IntegerField(read_only=True)
+    unverified_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Folder
         fields = ['id', 'client', 'name', 'created_by', 'created_by_name', 'is_system', 'created_at', 'document_count', 'verified_count', 'unverified_count']
         read_only_fields = ['client', 'created_by', 'is_system', 'created_at']
 
-    def get_document_count(self, obj):
-        return obj.documents.count()
-
-    def get_verified_count(self, obj):
-        return obj.documents.filter(status='VERIFIED').count()
-
-    def get_unverified_count(self, obj):
-        return obj.documents.exclude(status='VERIFIED').count()
-
 class DocumentSerializer(serializers.ModelSerializer):
-    client_name = serializers.ReadOnlyField(source='client.get_full_name')
-    consultant_name = serializers.ReadOnlyField(source='consultant.get_full_name')
+    client_name = serializers.ReadOnlyField(source='client.full_name')
+    consultant_name = serializers.ReadOnlyField(source='consultant.full_name')
     folder_name = serializers.ReadOnlyField(source='folder.name')
     granted_consultant_ids = serializers.SerializerMethodField()
     has_access = serializers.SerializerMethodField()
@@ -38,12 +30,16 @@ class DocumentSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['client', 'consultant', 'status', 'created_at', 'uploaded_at']
 
-    def get_granted_consultant_ids(self, obj):
+    def _granted_ids(self, obj):
+        # access_grants.all() reads the list view's prefetch instead of querying per row
         try:
-            return list(obj.access_grants.values_list('consultant_id', flat=True))
+            return [grant.consultant_id for grant in obj.access_grants.all()]
         except (ProgrammingError, OperationalError):
             # Graceful fallback if migration for vault_document_access is not applied yet.
-            return []
+            return None
+
+    def get_granted_consultant_ids(self, obj):
+        return self._granted_ids(obj) or []
 
     def get_has_access(self, obj):
         request = self.context.get('request')
@@ -52,10 +48,7 @@ class DocumentSerializer(serializers.ModelSerializer):
             return False
         if user.role != 'CONSULTANT':
             return True
-        try:
-            return obj.access_grants.filter(consultant_id=user.id).exists()
-        except (ProgrammingError, OperationalError):
-            return False
+        return user.id in (self._granted_ids(obj) or [])
 
     def to_representation(self, instance):
         data = super().to_representation(instance)
@@ -71,6 +64,13 @@ class DocumentSerializer(serializers.ModelSerializer):
 
         return data
 
+# Compact response for status-only changes such as a review
+class DocumentStatusSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Document
+        fields = ['id', 'status', 'uploaded_at']
+        read_only_fields = fields
+
 class DocumentUploadSerializer(serializers.ModelSerializer):
     class Meta:
         model = Document
@@ -79,10 +79,17 @@ class DocumentUploadSerializer(serializers.ModelSerializer):
             'file': {'required': True}
         }
 
+    def update(self, instance, validated_data):
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        # Only the upload's own columns change; leave the rest of the row alone
+        instance.save(update_fields=list(validated_data))
+        return instance
+
 
 class SharedReportSerializer(serializers.ModelSerializer):
-    client_name = serializers.ReadOnlyField(source='client.get_full_name')
-    consultant_name = serializers.ReadOnlyField(source='consultant.get_full_name')
+    client_name = serializers.ReadOnlyField(source='client.full_name')
+    consultant_name = serializers.ReadOnlyField(source='consultant.full_name')
     
     class Meta:
         model = SharedReport
@@ -94,9 +101,9 @@ class SharedReportSerializer(serializers.ModelSerializer):
 
 
 class LegalNoticeSerializer(serializers.ModelSerializer):
-    client_name = serializers.ReadOnlyField(source='client.get_full_name')
-    consultant_name = serializers.ReadOnlyField(source='consultant.get_full_name')
-    uploaded_by_name = serializers.ReadOnlyField(source='uploaded_by.get_full_name')
+    client_name = serializers.ReadOnlyField(source='client.full_name')
+    consultant_name = serializers.ReadOnlyField(source='consultant.full_name')
+    uploaded_by_name = serializers.ReadOnlyField(source='uploaded_by.full_name')
     
     class Meta:
         model = LegalNotice
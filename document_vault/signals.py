@@ -1,31 +1,41 @@
+import logging
+
 from django.db.models.signals import post_delete
 from django.dispatch import receiver
-from .models import Document, SharedReport, LegalNotice
-import os
+from .models import Document, SharedReport, LegalNotice, file_delete_queued_by_bulk_delete
+from .tasks import queue_storage_file_deletes
+
+logger = logging.getLogger(__name__)
+
+
+def _delete_file_after_commit(instance, label):
+    """
+    Queue the storage delete once the row deletion has committed, so a
+    rolled-back delete never loses the file and the request never waits on S3.
+    Queryset deletes queue all of their files in one task themselves.
+    """
+    if not instance.file or file_delete_queued_by_bulk_delete(instance):
+        return
+    queue_storage_file_deletes([instance.file.name])
+    logger.debug("Queued storage file delete (%s): %s", label, instance.title)
 
 @receiver(post_delete, sender=Document)
 def auto_delete_file_on_delete_document(sender, instance, **kwargs):
     """
     Deletes file from storage when corresponding Document object is deleted.
     """
-    if instance.file:
-        instance.file.delete(save=False)
-        print(f"Deleted storage file (Document): {instance.title}")
+    _delete_file_after_commit(instance, 'Document')
 
 @receiver(post_delete, sender=SharedReport)
 def auto_delete_file_on_delete_report(sender, instance, **kwargs):
     """
     Deletes file from storage when corresponding SharedReport object is deleted.
     """
-    if instance.file:
-        instance.file.delete(save=False)
-        print(f"Deleted storage file (Report): {instance.title}")
+    _delete_file_after_commit(instance, 'Report')
 
 @receiver(post_delete, sender=LegalNotice)
 def auto_delete_file_on_delete_notice(sender, instance, **kwargs):
     """
     Deletes file from storage when corresponding LegalNotice object is deleted.
     """
-    if instance.file:
-        instance.file.delete(save=False)
-        print(f"Deleted storage file (Notice): {instance.title}")
+    _delete_file_after_commit(instance, 'Notice')
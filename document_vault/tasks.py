@@ -0,0 +1,59 @@
+import logging
+from functools import partial
+
+from celery import shared_task
+from django.core.files.storage import default_storage
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+# S3 DeleteObjects accepts at most 1000 keys per call
+S3_DELETE_BATCH_SIZE = 1000
+
+
+def _enqueue_storage_file_deletes(names):
+    # Runs after the rows are committed: a broker outage must not turn the
+    # delete into a 500, so log the orphaned names for cleanup instead
+    try:
+        delete_storage_files.delay(names)
+    except Exception:
+        logger.exception("Could not queue storage delete for %d file(s): %s", len(names), names)
+
+
+def queue_storage_file_deletes(names):
+    """Queue one delete_storage_files task for these files once the transaction commits."""
+    if names:
+        transaction.on_commit(partial(_enqueue_storage_file_deletes, list(names)))
+
+
+def _s3_key(storage, name):
+    location = storage.location.strip('/')
+    return f"{location}/{name}" if location else name
+
+
+def _delete_s3_objects(storage, names):
+    for start in range(0, len(names), S3_DELETE_BATCH_SIZE):
+        keys = [{'Key': _s3_key(storage, name)} for name in names[start:start + S3_DELETE_BATCH_SIZE]]
+        response = storage.bucket.delete_objects(Delete={'Objects': keys, 'Quiet': True})
+        errors = response.get('Errors')
+        if errors:
+            raise RuntimeError(f"S3 refused {len(errors)} deletes, first: {errors[0]}")
+
+
+@shared_task(bind=True, max_retries=3)
+def delete_storage_files(self, names):
+    """
+    Celery task to remove deleted vault records' files from storage, so the
+    S3 round trips happen outside the request that deleted them. On S3 the
+    files go in DeleteObjects batches rather than one request per file.
+    """
+    try:
+        if hasattr(default_storage, 'bucket'):
+            _delete_s3_objects(default_storage, names)
+        else:
+            for name in names:
+                default_storage.delete(name)
+        logger.debug("Deleted %d storage file(s)", len(names))
+    except Exception as exc:
+        logger.error(f"Error in delete_storage_files for {len(names)} file(s): {exc}")
+        raise self.retry(exc=exc, countdown=5 * (self.request.retries + 1))
@@ -0,0 +1,226 @@
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from consultants.models import ClientServiceRequest, ConsultantServiceProfile, Service, ServiceCategory
+from core_auth.models import User
+from document_vault.models import Document, DocumentAccess, Folder
+from document_vault.views import create_system_folders
+
+
+class DocumentViewSetListTests(TestCase):
+    def setUp(self):
+        self.client_user = User.objects.create_user(
+            username='doc_client',
+            password='password',
+            role=User.CLIENT,
+            first_name='Asha',
+            last_name='Rao',
+        )
+        self.folder = Folder.objects.create(client=self.client_user, name='KYC', is_system=True)
+        for title in ('PAN Card', 'Aadhaar', 'Passport'):
+            Document.objects.create(client=self.client_user, folder=self.folder, title=title, status='UPLOADED')
+        self.api = APIClient()
+        self.api.force_authenticate(user=self.client_user)
+
+    def test_list_reads_names_from_the_joined_rows(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.api.get(reverse('document-list'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual({row['client_name'] for row in response.data}, {'Asha Rao'})
+        self.assertEqual({row['folder_name'] for row in response.data}, {'KYC'})
+        # No deferred user or folder column is loaded one row at a time
+        lazy_loads = [
+            q['sql'] for q in ctx.captured_queries
+            if q['sql'].startswith(('SELECT "core_auth_user"', 'SELECT "vault_folders"'))
+        ]
+        self.assertEqual(lazy_loads, [])
+
+    def test_access_grants_are_prefetched(self):
+        consultant = User.objects.create_user(username='doc_granted', password='password', role=User.CONSULTANT)
+        for document in Document.objects.all():
+            DocumentAccess.objects.create(document=document, consultant=consultant)
+
+        # Assigned consultants, the access-table check, documents and their grants;
+        # not one query per document
+        with self.assertNumQueries(4):
+            response = self.api.get(reverse('document-list'))
+
+        self.assertEqual({tuple(row['granted_consultant_ids']) for row in response.data}, {(consultant.id,)})
+
+    def test_pending_count_comes_from_one_query(self):
+        Document.objects.create(client=self.client_user, title='Form 16', status='PENDING')
+        Document.objects.create(client=self.client_user, title='Bank statement', status='REJECTED')
+
+        with self.assertNumQueries(1):
+            response = self.api.get(reverse('document-pending-count'))
+
+        self.assertEqual(response.data, {'count': 2, 'pending': 1, 'rejected': 1})
+
+    def test_list_is_paginated_only_when_page_size_is_sent(self):
+        response = self.api.get(reverse('document-list'), {'page_size': 2})
+
+        self.assertEqual(response.data['count'], 3)
+        self.assertEqual(len(response.data['results']), 2)
+        self.assertIsNotNone(response.data['next'])
+
+        self.assertEqual(len(self.api.get(reverse('document-list')).data), 3)
+
+    def test_later_pages_reuse_the_first_page_count(self):
+        cache.clear()
+        self.api.get(reverse('document-list'), {'page_size': 2})
+        Document.objects.create(client=self.client_user, folder=self.folder, title='Voter ID', status='UPLOADED')
+
+        with CaptureQueriesContext(connection) as ctx:
+            second = self.api.get(reverse('document-list'), {'page_size': 2, 'page': 2})
+        first = self.api.get(reverse('document-list'), {'page_size': 2, 'page': 1})
+
+        self.assertEqual(second.data['count'], 3)
+        self.assertFalse([q for q in ctx.captured_queries if 'COUNT(' in q['sql']])
+        self.assertEqual(first.data['count'], 4)
+
+    def test_cached_count_is_kept_per_folder(self):
+        cache.clear()
+        other = Folder.objects.create(client=self.client_user, name='Bank Details', is_system=True)
+        Document.objects.create(client=self.client_user, folder=other, title='Statement', status='UPLOADED')
+        self.api.get(reverse('document-list'), {'page_size': 1, 'folder_id': self.folder.id})
+
+        response = self.api.get(reverse('document-list'), {'page_size': 1, 'page': 1, 'folder_id': other.id})
+        later = self.api.get(reverse('document-list'), {'page_size': 1, 'page': 2, 'folder_id': self.folder.id})
+
+        self.assertEqual(response.data['count'], 1)
+        self.assertEqual(later.data['count'], 3)
+
+
+class DocumentViewSetCreateTests(TestCase):
+    def setUp(self):
+        self.consultant = User.objects.create_user(username='doc_consultant', password='password', role=User.CONSULTANT)
+        self.client_user = User.objects.create_user(username='doc_assigned', password='password', role=User.CLIENT)
+        ClientServiceRequest.objects.create(
+            client=self.client_user,
+            service=Service.objects.create(category=ServiceCategory.objects.create(name='Tax'), title='ITR Filing'),
+            assigned_consultant=ConsultantServiceProfile.objects.create(user=self.consultant, qualification='CA'),
+            status='assigned',
+        )
+        self.api = APIClient()
+        self.api.force_authenticate(user=self.consultant)
+
+    def _request_document(self, client_id):
+        return self.api.post(reverse('document-list'), {'client': client_id, 'title': 'Form 16'}, format='json')
+
+    def test_consultant_requests_document_from_assigned_client(self):
+        response = self._request_document(self.client_user.id)
+
+        self.assertEqual(response.status_code, 201)
+        document = Document.objects.get(id=response.data['id'])
+        self.assertEqual((document.client, document.consultant, document.status), (self.client_user, self.consultant, 'PENDING'))
+
+    def test_unassigned_or_invalid_clients_are_refused(self):
+        stranger = User.objects.create_user(username='doc_stranger', password='password', role=User.CLIENT)
+
+        self.assertEqual(self._request_document(stranger.id).status_code, 403)
+        self.assertEqual(self._request_document('abc').status_code, 400)
+        self.assertFalse(Document.objects.exists())
+
+    def test_folder_must_belong_to_the_client(self):
+        own = Folder.objects.create(client=self.client_user, name='Tax Returns')
+        other = Folder.objects.create(
+            client=User.objects.create_user(username='doc_other', password='password', role=User.CLIENT),
+            name='Tax Returns',
+        )
+
+        def request_into(folder_id):
+            return self.api.post(
+                reverse('document-list'),
+                {'client': self.client_user.id, 'title': 'Form 16', 'folder': folder_id},
+                format='json',
+            )
+
+        self.assertEqual(request_into(other.id).status_code, 400)
+        self.assertEqual(request_into(own.id + other.id).status_code, 400)
+        response = request_into(own.id)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['folder'], own.id)
+
+    def test_folder_owner_is_read_with_the_assignment_check(self):
+        folder = Folder.objects.create(client=self.client_user, name='Tax Returns')
+        create_system_folders(self.client_user)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.api.post(
+                reverse('document-list'),
+                {'client': self.client_user.id, 'title': 'Form 16', 'folder': folder.id},
+                format='json',
+            )
+
+        sql = [q['sql'] for q in ctx.captured_queries]
+        self.assertEqual(len([q for q in sql if 'AS "folder_client_id"' in q]), 1)
+        self.assertFalse([q for q in sql if q.startswith('SELECT "vault_folders"."client_id"')])
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(DocumentAccess.objects.filter(document_id=response.data['id'], consultant=self.consultant).exists())
+
+    def test_access_check_is_read_with_the_document(self):
+        document = Document.objects.create(client=self.client_user, consultant=self.consultant, title='Form 16')
+        DocumentAccess.objects.create(document=document, consultant=self.consultant)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.api.post(reverse('document-request-access', args=[document.id]), format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['message'], 'Access already granted for this document.')
+        access_queries = [q['sql'] for q in ctx.captured_queries if 'vault_document_access' in q['sql']]
+        self.assertEqual(len(access_queries), 1)
+        self.assertTrue(access_queries[0].startswith('SELECT "document_vault_document"'))
+
+    def test_review_saves_status_and_rejection_reason(self):
+        document = Document.objects.create(
+            client=self.client_user, consultant=self.consultant, title='Form 16',
+            description='Required for ITR Filing', status='UPLOADED',
+        )
+
+        response = self.api.post(
+            reverse('document-review-document', args=[document.id]),
+            {'status': 'REJECTED', 'rejection_reason': 'Blurry scan'},
+            format='json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, {'id': document.id, 'status': 'REJECTED', 'uploaded_at': None})
+        document.refresh_from_db()
+        self.assertEqual(document.status, 'REJECTED')
+        self.assertEqual(document.description, 'Required for ITR Filing | REJECTION REASON: Blurry scan')
+
+
+@override_settings(STORAGES={
+    'default': {'BACKEND': 'django.core.files.storage.InMemoryStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+})
+class DocumentUploadTests(TestCase):
+    def setUp(self):
+        self.client_user = User.objects.create_user(username='upload_client', password='password', role=User.CLIENT)
+        self.document = Document.objects.create(client=self.client_user, title='Form 16', status='PENDING')
+        self.api = APIClient()
+        self.api.force_authenticate(user=self.client_user)
+
+    def test_upload_writes_only_the_upload_columns(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.api.post(
+                reverse('document-upload-file', args=[self.document.id]),
+                {'file': SimpleUploadedFile('form16.pdf', b'%PDF-1.4'), 'file_password': 'secret'},
+                format='multipart',
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['status'], 'UPLOADED')
+        self.document.refresh_from_db()
+        self.assertTrue(self.document.file.name.startswith(f'vault/client_{self.client_user.id}/'))
+        self.assertEqual(self.document.file_password, 'secret')
+        self.assertIsNotNone(self.document.uploaded_at)
+        updates = [q['sql'] for q in ctx.captured_queries if q['sql'].startswith('UPDATE "document_vault_document"')]
+        self.assertEqual(len(updates), 1)
+        self.assertNotIn('"title"', updates[0])
@@ -0,0 +1,117 @@
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from consultants.models import ClientServiceRequest, ConsultantServiceProfile, Service, ServiceCategory
+from core_auth.models import User
+from document_vault.models import Document, Folder
+from document_vault.views import SYSTEM_FOLDER_NAMES, create_system_folders
+
+
+class FolderViewSetTests(TestCase):
+    def setUp(self):
+        self.client_user = User.objects.create_user(
+            username='vault_client',
+            email='vault-client@example.com',
+            password='password',
+            role=User.CLIENT,
+        )
+        self.api = APIClient()
+        self.api.force_authenticate(user=self.client_user)
+
+    def test_list_counts_documents_in_one_query(self):
+        for name, statuses in [('KYC', ['VERIFIED', 'PENDING']), ('Bank', ['UPLOADED']), ('Empty', [])]:
+            folder = Folder.objects.create(client=self.client_user, name=name, created_by=self.client_user)
+            for doc_status in statuses:
+                Document.objects.create(client=self.client_user, folder=folder, title=name, status=doc_status)
+
+        with self.assertNumQueries(1):
+            response = self.api.get(reverse('folder-list'))
+
+        counts = {
+            row['name']: (row['document_count'], row['verified_count'], row['unverified_count'])
+            for row in response.data
+        }
+        self.assertEqual(counts, {'Bank': (1, 0, 1), 'Empty': (0, 0, 0), 'KYC': (2, 1, 1)})
+
+    def test_created_folder_reports_zero_counts(self):
+        response = self.api.post(reverse('folder-list'), {'name': 'Invoices'}, format='json')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['document_count'], 0)
+        self.assertEqual(response.data['unverified_count'], 0)
+
+    def test_duplicate_name_is_rejected_by_the_constraint(self):
+        Folder.objects.create(client=self.client_user, name='Invoices', created_by=self.client_user)
+
+        response = self.api.post(reverse('folder-list'), {'name': 'Invoices'}, format='json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('name', response.data)
+        self.assertEqual(Folder.objects.filter(client=self.client_user, name='Invoices').count(), 1)
+
+
+class FolderViewSetConsultantTests(TestCase):
+    def setUp(self):
+        self.consultant = User.objects.create_user(username='folder_consultant', password='password', role=User.CONSULTANT)
+        self.client_user = User.objects.create_user(username='folder_client', password='password', role=User.CLIENT)
+        ClientServiceRequest.objects.create(
+            client=self.client_user,
+            service=Service.objects.create(category=ServiceCategory.objects.create(name='Tax'), title='GST Filing'),
+            assigned_consultant=ConsultantServiceProfile.objects.create(user=self.consultant, qualification='CA'),
+            status='assigned',
+        )
+        self.api = APIClient()
+        self.api.force_authenticate(user=self.consultant)
+
+    def test_consultant_creates_folder_for_assigned_client_only(self):
+        stranger = User.objects.create_user(username='folder_stranger', password='password', role=User.CLIENT)
+
+        created = self.api.post(reverse('folder-list'), {'name': 'Invoices', 'client': self.client_user.id}, format='json')
+        refused = self.api.post(reverse('folder-list'), {'name': 'Invoices', 'client': stranger.id}, format='json')
+
+        self.assertEqual(created.status_code, 201)
+        self.assertEqual(created.data['client'], self.client_user.id)
+        self.assertEqual(refused.status_code, 403)
+        self.assertFalse(Folder.objects.filter(client=stranger).exists())
+
+    def test_client_with_several_requests_lists_each_folder_once(self):
+        ClientServiceRequest.objects.create(
+            client=self.client_user,
+            service=Service.objects.create(category=ServiceCategory.objects.get(name='Tax'), title='ITR Filing'),
+            assigned_consultant=self.consultant.consultant_service_profile,
+            status='assigned',
+        )
+        Folder.objects.create(client=self.client_user, name='Invoices', created_by=self.consultant)
+
+        response = self.api.get(reverse('folder-list'), {'client_id': self.client_user.id})
+
+        self.assertEqual(sorted(row['name'] for row in response.data), sorted(['Invoices', *SYSTEM_FOLDER_NAMES]))
+
+    def test_consultant_deletes_folder_with_one_lookup(self):
+        folder = Folder.objects.create(client=self.client_user, name='Invoices', created_by=self.consultant)
+
+        # The folder (assigned-client check inlined), its documents' FK cleanup and the delete
+        with self.assertNumQueries(3):
+            response = self.api.delete(reverse('folder-detail', args=[folder.id]))
+
+        self.assertEqual(response.status_code, 204)
+        self.assertFalse(Folder.objects.filter(id=folder.id).exists())
+
+
+class CreateSystemFoldersTests(TestCase):
+    def setUp(self):
+        self.client_user = User.objects.create_user(username='system_client', password='password', role=User.CLIENT)
+
+    def test_missing_folders_are_inserted_together(self):
+        Folder.objects.create(client=self.client_user, name='KYC', is_system=True)
+
+        with self.assertNumQueries(2):
+            create_system_folders(self.client_user)
+        with self.assertNumQueries(1):
+            create_system_folders(self.client_user)
+
+        self.assertEqual(
+            sorted(Folder.objects.filter(client=self.client_user, is_system=True).values_list('name', flat=True)),
+            sorted(SYSTEM_FOLDER_NAMES),
+        )
@@ -0,0 +1,102 @@
+from unittest.mock import patch
+
+from django.db import transaction
+from django.test import SimpleTestCase, TestCase
+
+from core_auth.models import User
+from document_vault import tasks
+from document_vault.models import Document, document_file_path
+
+
+class StorageCleanupSignalTests(TestCase):
+    def setUp(self):
+        self.client_user = User.objects.create_user(username='cleanup_client', password='password', role=User.CLIENT)
+
+    def _document(self, name, **kwargs):
+        return Document.objects.create(client=self.client_user, title=name, file=f'vault/client_1/{name}.pdf', **kwargs)
+
+    @patch('document_vault.tasks.delete_storage_files')
+    def test_file_delete_is_queued_after_commit(self, mock_task):
+        document = self._document('pan')
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            document.delete()
+            mock_task.delay.assert_not_called()
+
+        self.assertEqual(len(callbacks), 1)
+        mock_task.delay.assert_called_once_with(['vault/client_1/pan.pdf'])
+
+    @patch('document_vault.tasks.delete_storage_files')
+    def test_queryset_delete_queues_one_task(self, mock_task):
+        for name in ('pan', 'aadhaar', 'passport'):
+            self._document(name)
+        Document.objects.create(client=self.client_user, title='Form 16')
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            Document.objects.filter(client=self.client_user).delete()
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertCountEqual(mock_task.delay.call_args.args[0], [
+            'vault/client_1/pan.pdf', 'vault/client_1/aadhaar.pdf', 'vault/client_1/passport.pdf',
+        ])
+
+    @patch('document_vault.tasks.delete_storage_files')
+    def test_broker_outage_does_not_fail_the_delete(self, mock_task):
+        mock_task.delay.side_effect = ConnectionError('broker down')
+        document = self._document('pan')
+
+        with self.assertLogs('document_vault.tasks', level='ERROR') as logs:
+            with self.captureOnCommitCallbacks(execute=True):
+                document.delete()
+
+        self.assertFalse(Document.objects.filter(pk=document.pk).exists())
+        self.assertIn('vault/client_1/pan.pdf', logs.output[0])
+
+    @patch('document_vault.tasks.delete_storage_files')
+    def test_rolled_back_savepoint_keeps_its_files(self, mock_task):
+        kept, removed = self._document('kept'), self._document('removed')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            removed.delete()
+            try:
+                with transaction.atomic():
+                    kept.delete()
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+
+        mock_task.delay.assert_called_once_with(['vault/client_1/removed.pdf'])
+
+
+class DeleteStorageFilesTaskTests(SimpleTestCase):
+    @patch.object(tasks, 'S3_DELETE_BATCH_SIZE', 2)
+    def test_s3_deletes_go_out_in_batches(self):
+        with patch.object(tasks, 'default_storage') as storage:
+            storage.location = 'media'
+            storage.bucket.delete_objects.return_value = {}
+
+            tasks.delete_storage_files(['a.pdf', 'b.pdf', 'c.pdf'])
+
+        batches = [call.kwargs['Delete']['Objects'] for call in storage.bucket.delete_objects.call_args_list]
+        self.assertEqual(batches, [
+            [{'Key': 'media/a.pdf'}, {'Key': 'media/b.pdf'}],
+            [{'Key': 'media/c.pdf'}],
+        ])
+
+    def test_other_storages_delete_each_stored_name(self):
+        with patch.object(tasks, 'default_storage', spec=['delete']) as storage:
+            tasks.delete_storage_files(['vault/client_1/a.pdf', 'vault/client_1/b.pdf'])
+
+        self.assertEqual(
+            [call.args for call in storage.delete.call_args_list],
+            [('vault/client_1/a.pdf',), ('vault/client_1/b.pdf',)],
+        )
+
+
+class UploadPathTests(SimpleTestCase):
+    def test_path_uses_client_id_without_loading_the_client(self):
+        path = document_file_path(Document(client_id=42), 'form16.pdf')
+
+        prefix, _, name = path.rpartition('/')
+        self.assertEqual(prefix, 'vault/client_42')
+        self.assertRegex(name, r'^[0-9a-f]{32}_form16\.pdf$')
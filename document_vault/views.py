@@ -1,32 +1,110 @@
 from io import BytesIO
+import hashlib
 import logging
 import mimetypes
 import os
 
-from django.db import models, connection
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.paginator import InvalidPage, Paginator as DjangoPaginator
+from django.db import IntegrityError, connection, models, transaction
 from django.http import FileResponse, HttpResponse
 from django.utils import timezone
+from django.utils.functional import cached_property
 from rest_framework import viewsets, permissions, status, decorators
+from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 
 from notifications.models import Notification
+from notifications.signals import create_and_push_notification
 from .models import Document, SharedReport, LegalNotice, Folder, DocumentAccess, DocumentDownloadLog
-from .serializers import DocumentSerializer, DocumentUploadSerializer, SharedReportSerializer, LegalNoticeSerializer, FolderSerializer
+from .serializers import DocumentSerializer, DocumentStatusSerializer, DocumentUploadSerializer, SharedReportSerializer, LegalNoticeSerializer, FolderSerializer
 from core_auth.serializers import IsConsultantUser, IsClientUser
 from consultants.models import ClientServiceRequest
+from consultants.utils import get_active_consultant_for_client
 from core_auth.utils import get_active_profile
 
 logger = logging.getLogger(__name__)
+User = get_user_model()
+
+
+# How long a paginated list's total row count is reused across its later
+# pages; kept short so an upload or delete shows up in count within seconds
+VAULT_COUNT_CACHE_TTL_SECONDS = 5
+
+
+class _KnownCountPaginator(DjangoPaginator):
+    """Paginator that takes its total from the caller instead of running COUNT(*)."""
+
+    def __init__(self, object_list, per_page, count):
+        super().__init__(object_list, per_page)
+        self._count = count
+
+    @cached_property
+    def count(self):
+        return self._count
+
+
+class VaultPagination(PageNumberPagination):
+    """
+    Opt-in pagination: plain lists unless the caller sends ?page_size=.
+    The total count is cached briefly per user and filter set while the
+    caller pages through; requesting the first page recounts it.
+    """
+    page_size = None
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+
+    def get_count(self, queryset, request):
+        # Everything but the page selection (folder_id and any other filter) is in the key
+        filters = sorted(
+            (key, value) for key, value in request.query_params.lists()
+            if key not in (self.page_query_param, self.page_size_query_param)
+        )
+        digest = hashlib.sha256(repr((request.path, filters)).encode()).hexdigest()
+        cache_key = f'vault_count:{get_active_profile(request).id}:{digest}'
+
+        first_page = (request.query_params.get(self.page_query_param) or '1') == '1'
+        count = None if first_page else cache.get(cache_key)
+        if count is None:
+            count = DjangoPaginator(queryset, 1).count
+            cache.set(cache_key, count, VAULT_COUNT_CACHE_TTL_SECONDS)
+        return count
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        paginator = _KnownCountPaginator(queryset, page_size, count=self.get_count(queryset, request))
+        page_number = self.get_page_number(request, paginator)
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            raise NotFound(self.invalid_page_message.format(page_number=page_number, message=str(exc)))
+        if paginator.num_pages > 1 and self.template is not None:
+            self.display_page_controls = True
+        return list(self.page)
+
+
+SYSTEM_FOLDER_NAMES = ["KYC", "Bank Details", "GST Details", "Company Docs"]
+
 
 def create_system_folders(client_user):
     """Creates default system folders for a client."""
-    system_folders = ["KYC", "Bank Details", "GST Details", "Company Docs"]
-    for folder_name in system_folders:
-        Folder.objects.get_or_create(
-            client=client_user,
-            name=folder_name,
-            defaults={'is_system': True}
-        )
+    existing = set(
+        Folder.objects.filter(client=client_user, name__in=SYSTEM_FOLDER_NAMES).values_list('name', flat=True)
+    )
+    missing = [
+        Folder(client=client_user, name=folder_name, is_system=True)
+        for folder_name in SYSTEM_FOLDER_NAMES
+        if folder_name not in existing
+    ]
+    if missing:
+        # unique (client, name) makes a concurrent insert of the same folder a no-op
+        Folder.objects.bulk_create(missing, ignore_conflicts=True)
 
 
 def _has_document_access_table():
@@ -63,11 +141,41 @@ def _build_download_alert_message(document, consultant, purpose):
 
 
 def _consultant_has_document_access(document, consultant):
+    # DocumentViewSet annotates the flag for its access-checked actions
+    annotated = getattr(document, 'consultant_has_access', None)
+    if annotated is not None:
+        return annotated
     if not _has_document_access_table():
         return False
     return DocumentAccess.objects.filter(document=document, consultant=consultant).exists()
 
 
+def _get_assigned_client(consultant, client_id, folder_id=None):
+    """
+    Security: return the client, checking in the same query that they are
+    assigned to this consultant via a service request. With folder_id the
+    folder's owner comes back on the same row as client.folder_client_id.
+    """
+    try:
+        qs = User.objects.filter(
+            id=client_id,
+            service_requests__assigned_consultant__user=consultant,
+        )
+    except (TypeError, ValueError):
+        raise ValidationError({"client": "Invalid client ID"})
+    if folder_id:
+        try:
+            folder_client = Folder.objects.filter(id=folder_id).values('client_id')[:1]
+        except (TypeError, ValueError):
+            raise ValidationError({"folder": "Invalid folder ID."})
+        qs = qs.annotate(folder_client_id=models.Subquery(folder_client))
+
+    client = qs.first()
+    if client is None:
+        raise PermissionDenied("This client is not assigned to you.")
+    return client
+
+
 def _build_preview_watermark_text(consultant):
     consultant_name = _safe_display_name(consultant)
     return f"CONFIDENTIAL - PREVIEW ONLY - {consultant_name}"
@@ -201,25 +309,35 @@ class FolderViewSet(viewsets.ModelViewSet):
         client_id = self.request.query_params.get('client_id')
         
         if user.role == 'CONSULTANT':
-            # Get clients assigned via service requests
+            # Get clients assigned via service requests. An IN subquery never
+            # repeats a row, however many requests a client has, so the
+            # querysets below need no DISTINCT.
             service_client_ids = ClientServiceRequest.objects.filter(
                 assigned_consultant__user=user
             ).values_list('client_id', flat=True)
             
             if client_id:
                 # Consultant viewing folders for a specific client
-                return Folder.objects.filter(
+                qs = Folder.objects.filter(
                     client_id=client_id,
                     client_id__in=service_client_ids
-                ).distinct()
-            
-            # Default to all folders for any service-assigned clients
-            return Folder.objects.filter(
-                client_id__in=service_client_ids
-            ).distinct()
-        
-        # Clients see their own folders
-        return Folder.objects.filter(client=user)
+                )
+            else:
+                # Default to all folders for any service-assigned clients
+                qs = Folder.objects.filter(
+                    client_id__in=service_client_ids
+                )
+        else:
+            # Clients see their own folders
+            qs = Folder.objects.filter(client=user)
+
+        # Document counts come from one GROUP BY instead of three COUNTs per folder
+        verified = models.Q(documents__status='VERIFIED')
+        return qs.select_related('created_by').annotate(
+            document_count=models.Count('documents'),
+            verified_count=models.Count('documents', filter=verified),
+            unverified_count=models.Count('documents', filter=~verified),
+        )
 
     def perform_create(self, serializer):
         user = get_active_profile(self.request)
@@ -228,46 +346,44 @@ class FolderViewSet(viewsets.ModelViewSet):
         
         target_client = user
         if user.role == 'CONSULTANT':
-            # Security: Ensure client is assigned via active service
-            from core_auth.models import ClientProfile
-            
-            is_service = ClientServiceRequest.objects.filter(client_id=client_id, assigned_consultant__user=user).exists()
-            
-            if not is_service:
-                from rest_framework.exceptions import PermissionDenied
-                raise PermissionDenied("This client is not assigned to you.")
-            
-            from django.contrib.auth import get_user_model
-            User = get_user_model()
-            try:
-                target_client = User.objects.get(id=client_id)
-            except (User.DoesNotExist, ValueError):
-                from rest_framework.exceptions import ValidationError
-                raise ValidationError({"client": "Invalid client ID"})
+            target_client = _get_assigned_client(user, client_id)
 
         # Ensure system folders exist
         create_system_folders(target_client)
 
-        # Check for duplicate name
-        from rest_framework.exceptions import ValidationError
-        if Folder.objects.filter(client=target_client, name=name).exists():
+        # Duplicate names are caught by the (client, name) unique constraint
+        # on insert rather than a separate lookup that a concurrent create could race
+        try:
+            with transaction.atomic():
+                folder = serializer.save(client=target_client, created_by=user)
+        except IntegrityError:
             raise ValidationError({"name": f"A folder named '{name}' already exists."})
-
-        if user.role == 'CONSULTANT':
-            serializer.save(created_by=user, client=target_client)
-        else:
-            serializer.save(client=user, created_by=user)
+        # A new folder is empty; set the counts the list queryset annotates
+        folder.document_count = folder.verified_count = folder.unverified_count = 0
 
     def destroy(self, request, *args, **kwargs):
         folder = self.get_object()
         if folder.is_system:
             return Response({'error': 'System folders cannot be deleted'}, status=status.HTTP_400_BAD_REQUEST)
-        return super().destroy(request, *args, **kwargs)
+        # Delete the folder already fetched; super().destroy() would rerun the
+        # assigned-client queryset for the same row
+        self.perform_destroy(folder)
+        return Response(status=status.HTTP_204_NO_CONTENT)
 
 class DocumentViewSet(viewsets.ModelViewSet):
     queryset = Document.objects.select_related('client', 'consultant', 'folder').all()
     serializer_class = DocumentSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = VaultPagination
+
+    # Columns DocumentSerializer reads; the joined user rows are wide
+    LIST_ONLY_FIELDS = (
+        'id', 'client', 'consultant', 'folder', 'title', 'description', 'file', 'file_password',
+        'status', 'created_at', 'uploaded_at',
+        'client__full_name', 'consultant__full_name', 'folder__name',
+    )
+    # Consultant actions gated on _consultant_has_document_access
+    ACCESS_CHECKED_ACTIONS = ('request_access', 'download_document', 'preview_document')
 
     def get_queryset(self):
         user = get_active_profile(self.request)
@@ -283,7 +399,7 @@ class DocumentViewSet(viewsets.ModelViewSet):
             # Consultants see docs for clients with active service assignments
             qs = Document.objects.select_related('client', 'consultant', 'folder').filter(
                 client_id__in=service_client_ids
-            ).distinct()
+            )
         else:
             # Clients see their own docs, but filter out PENDING requests from unassigned consultants
             # Get consultants assigned via active services
@@ -304,21 +420,40 @@ class DocumentViewSet(viewsets.ModelViewSet):
             
         if folder_id:
             qs = qs.filter(folder_id=folder_id)
+        if (
+            user.role == 'CONSULTANT'
+            and self.action in self.ACCESS_CHECKED_ACTIONS
+            and _has_document_access_table()
+        ):
+            # Fetch the access check with the document instead of a second query
+            qs = qs.annotate(consultant_has_access=models.Exists(
+                DocumentAccess.objects.filter(document=models.OuterRef('pk'), consultant=user)
+            ))
+        if self.action == 'list':
+            # Detail actions notify document.client, so they keep the full rows
+            qs = qs.only(*self.LIST_ONLY_FIELDS)
+            if _has_document_access_table():
+                qs = qs.prefetch_related(models.Prefetch(
+                    'access_grants', queryset=DocumentAccess.objects.only('document_id', 'consultant_id')
+                ))
         return qs
 
-    def _validate_folder_client(self, folder_id, client):
+    @staticmethod
+    def _check_folder_client(folder_client_id, client_id):
+        if folder_client_id is None:
+            raise ValidationError({"folder": "Invalid folder ID."})
+        if folder_client_id != client_id:
+            raise ValidationError({"folder": "This folder does not belong to the correct client."})
+
+    def _validate_folder_client(self, folder_id, client_id):
         """Helper to ensure folder belongs to the client."""
         if folder_id:
+            # Only the owner column is needed for the check
             try:
-                folder = Folder.objects.get(id=folder_id)
-                if folder.client != client:
-                    from rest_framework.exceptions import ValidationError
-                    raise ValidationError({"folder": "This folder does not belong to the correct client."})
-                return folder
-            except Folder.DoesNotExist:
-                from rest_framework.exceptions import ValidationError
-                raise ValidationError({"folder": "Invalid folder ID."})
-        return None
+                folder_client_id = Folder.objects.filter(id=folder_id).values_list('client_id', flat=True).first()
+            except (TypeError, ValueError):
+                folder_client_id = None
+            self._check_folder_client(folder_client_id, client_id)
 
     def perform_create(self, serializer):
         user = get_active_profile(self.request)
@@ -326,40 +461,25 @@ class DocumentViewSet(viewsets.ModelViewSet):
         client_id = self.request.data.get('client')
 
         if user.role == 'CONSULTANT':
-            # Security: Ensure client is assigned via active service
-            from core_auth.models import ClientProfile
-            from consultants.models import ClientServiceRequest
-            
-            is_service = ClientServiceRequest.objects.filter(client_id=client_id, assigned_consultant__user=user).exists()
-            
-            if not is_service:
-                from rest_framework.exceptions import PermissionDenied
-                raise PermissionDenied("This client is not assigned to you.")
-            
-            from django.contrib.auth import get_user_model
-            User = get_user_model()
-            try:
-                target_client = User.objects.get(id=client_id)
-            except (User.DoesNotExist, ValueError):
-                from rest_framework.exceptions import ValidationError
-                raise ValidationError({"client": "Invalid client ID"})
+            # Assignment check, client fetch and the folder's owner in one query
+            target_client = _get_assigned_client(user, client_id, folder_id=folder_id)
+            if folder_id:
+                self._check_folder_client(target_client.folder_client_id, target_client.id)
 
             # Ensure system folders exist for this client
             create_system_folders(target_client)
-            
-            # Validate folder belongs to target client
-            self._validate_folder_client(folder_id, target_client)
 
             document = serializer.save(consultant=user, client=target_client, folder_id=folder_id, status='PENDING')
             # Auto-grant: the requesting consultant can always see the request they created
             if _has_document_access_table():
-                DocumentAccess.objects.get_or_create(document=document, consultant=user)
+                # The document is new, so there is no existing grant to look up
+                DocumentAccess.objects.create(document=document, consultant=user)
         else:
             # Client creating a proactive upload
             # Ensure system folders exist
             create_system_folders(user)
             # Validate folder belongs to this client
-            self._validate_folder_client(folder_id, user)
+            self._validate_folder_client(folder_id, user.id)
             
             serializer.save(client=user, folder_id=folder_id, status='UPLOADED', uploaded_at=timezone.now())
 
@@ -379,7 +499,7 @@ class DocumentViewSet(viewsets.ModelViewSet):
                     status=status.HTTP_503_SERVICE_UNAVAILABLE
                 )
 
-            if document.client != active_user:
+            if document.client_id != active_user.id:
                 return Response({'error': 'Unauthorized'}, status=status.HTTP_403_FORBIDDEN)
 
             assigned = ClientServiceRequest.objects.filter(
@@ -435,7 +555,7 @@ class DocumentViewSet(viewsets.ModelViewSet):
                     status=status.HTTP_503_SERVICE_UNAVAILABLE
                 )
 
-            if document.client != active_user:
+            if document.client_id != active_user.id:
                 return Response({'error': 'Unauthorized'}, status=status.HTTP_403_FORBIDDEN)
 
             consultant_ids = request.data.get('consultant_ids', [])
@@ -499,7 +619,6 @@ class DocumentViewSet(viewsets.ModelViewSet):
                 message = f"{message} Note: {note}"
 
             try:
-                from notifications.signals import create_and_push_notification
                 create_and_push_notification(
                     recipient=document.client,
                     category='document',
@@ -526,12 +645,13 @@ class DocumentViewSet(viewsets.ModelViewSet):
         user = get_active_profile(self.request)
         # For updates, client and consultant are read-only in serializer, 
         # but we must still ensure the NEW folder belongs to the document's client.
-        document = self.get_object()
+        # update() already fetched the document through get_object()
+        document = serializer.instance
         folder_id = self.request.data.get('folder')
         
         # If folder is being changed
         if folder_id and 'folder' in self.request.data:
-            self._validate_folder_client(folder_id, document.client)
+            self._validate_folder_client(folder_id, document.client_id)
             
         serializer.save()
 
@@ -544,7 +664,7 @@ class DocumentViewSet(viewsets.ModelViewSet):
             
         # Security check: only the assigned client can upload
         active_user = get_active_profile(request)
-        if document.client != active_user:
+        if document.client_id != active_user.id:
             return Response({'error': 'Unauthorized'}, status=status.HTTP_403_FORBIDDEN)
             
         serializer = DocumentUploadSerializer(document, data=request.data, partial=True)
@@ -573,6 +693,7 @@ class DocumentViewSet(viewsets.ModelViewSet):
             return Response({'error': 'Invalid status'}, status=status.HTTP_400_BAD_REQUEST)
         
         document.status = new_status
+        update_fields = ['status']
         
         # Store rejection reason without destroying original description (metadata)
         if new_status == 'REJECTED' and rejection_reason:
@@ -580,9 +701,12 @@ class DocumentViewSet(viewsets.ModelViewSet):
                 document.description = f"{document.description} | REJECTION REASON: {rejection_reason}"
             else:
                 document.description = f"REJECTION REASON: {rejection_reason}"
+            update_fields.append('description')
         
-        document.save()
-        return Response(DocumentSerializer(document, context={'request': request}).data)
+        # save() rather than update(): the auto-WIP signal listens for the verified document
+        document.save(update_fields=update_fields)
+        # Only the review outcome changed; skip the file URL and access lookups
+        return Response(DocumentStatusSerializer(document).data)
 
     @decorators.action(detail=True, methods=['post'], url_path='download', permission_classes=[IsConsultantUser])
     def download_document(self, request, pk=None):
@@ -614,7 +738,6 @@ class DocumentViewSet(viewsets.ModelViewSet):
         notification_message = _build_download_alert_message(document, consultant, purpose)
         try:
             # Realtime push + DB persist for client-side toast/sound via notification websocket.
-            from notifications.signals import create_and_push_notification
             create_and_push_notification(
                 recipient=document.client,
                 category='document',
@@ -728,13 +851,15 @@ class DocumentViewSet(viewsets.ModelViewSet):
         Returns the count of pending and rejected document requests for the authenticated client.
         """
         user = get_active_profile(request)
-        pending = Document.objects.filter(client=user, status='PENDING').count()
-        rejected = Document.objects.filter(client=user, status='REJECTED').count()
+        counts = Document.objects.filter(client=user, status__in=['PENDING', 'REJECTED']).aggregate(
+            pending=models.Count('id', filter=models.Q(status='PENDING')),
+            rejected=models.Count('id', filter=models.Q(status='REJECTED')),
+        )
         
         return Response({
-            'count': pending + rejected,
-            'pending': pending,
-            'rejected': rejected
+            'count': counts['pending'] + counts['rejected'],
+            'pending': counts['pending'],
+            'rejected': counts['rejected']
         })
 
 
@@ -746,6 +871,7 @@ class SharedReportViewSet(viewsets.ModelViewSet):
     """
     serializer_class = SharedReportSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = VaultPagination
 
     def get_queryset(self):
         user = get_active_profile(self.request)
@@ -759,24 +885,21 @@ class SharedReportViewSet(viewsets.ModelViewSet):
             # Consultants see reports for clients who are:
             # 1. Primary assigned clients OR
             # 2. Clients with active service assignments
-            return SharedReport.objects.filter(
+            return SharedReport.objects.select_related('client', 'consultant').filter(
                 client_id__in=service_client_ids
-            ).filter(consultant=user).distinct()
+            ).filter(consultant=user)
         # Clients see reports shared with them
-        return SharedReport.objects.filter(client=user)
+        return SharedReport.objects.select_related('client', 'consultant').filter(client=user)
 
     def perform_create(self, serializer):
         user = get_active_profile(self.request)
         if user.role != 'CONSULTANT':
-            from rest_framework.exceptions import PermissionDenied
             raise PermissionDenied("Only consultants can share reports.")
         
         client_id = self.request.data.get('client')
         # Security: Ensure client is assigned to this consultant via active service
-        from core_auth.models import ClientProfile
         is_service = ClientServiceRequest.objects.filter(client_id=client_id, assigned_consultant__user=user).exists()
         if not is_service:
-            from rest_framework.exceptions import PermissionDenied
             raise PermissionDenied("This client is not assigned to you.")
             
         serializer.save(consultant=user)
@@ -788,17 +911,18 @@ class SharedReportViewSet(viewsets.ModelViewSet):
             return Response({'error': 'Only consultants can delete reports'}, status=status.HTTP_403_FORBIDDEN)
         
         report = self.get_object()
-        if report.consultant != user:
+        if report.consultant_id != user.id:
             return Response({'error': 'You can only delete your own shared reports'}, status=status.HTTP_403_FORBIDDEN)
         
-        return super().destroy(request, *args, **kwargs)
+        self.perform_destroy(report)
+        return Response(status=status.HTTP_204_NO_CONTENT)
 
     @decorators.action(detail=True, methods=['post'], url_path='mark-read', permission_classes=[permissions.IsAuthenticated])
     def mark_read(self, request, pk=None):
         """Mark a specific shared report as read by the client."""
         report = self.get_object()
         active_user = get_active_profile(request)
-        if report.client != active_user:
+        if report.client_id != active_user.id:
             return Response({'error': 'Unauthorized'}, status=status.HTTP_403_FORBIDDEN)
         report.is_read = True
         report.save(update_fields=['is_read'])
@@ -821,6 +945,7 @@ class LegalNoticeViewSet(viewsets.ModelViewSet):
     """
     serializer_class = LegalNoticeSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = VaultPagination
 
     def get_queryset(self):
         user = get_active_profile(self.request)
@@ -834,29 +959,25 @@ class LegalNoticeViewSet(viewsets.ModelViewSet):
             # Consultants see notices for clients who are:
             # 1. Primary assigned clients OR
             # 2. Clients with active service assignments
-            return LegalNotice.objects.filter(
+            return LegalNotice.objects.select_related('client', 'consultant', 'uploaded_by').filter(
                 client_id__in=service_client_ids
-            ).filter(consultant=user).distinct()
+            ).filter(consultant=user)
         # Clients see notices for them or uploaded by them
-        return LegalNotice.objects.filter(client=user)
+        return LegalNotice.objects.select_related('client', 'consultant', 'uploaded_by').filter(client=user)
 
     def perform_create(self, serializer):
         user = get_active_profile(self.request)
         if user.role == 'CONSULTANT':
             client_id = self.request.data.get('client')
-            from core_auth.models import ClientProfile
             is_service = ClientServiceRequest.objects.filter(client_id=client_id, assigned_consultant__user=user).exists()
             if not is_service:
-                from rest_framework.exceptions import PermissionDenied
                 raise PermissionDenied("This client is not assigned to you.")
             
             serializer.save(consultant=user, uploaded_by=user)
         else:
             # Client uploading a notice
-            from consultants.utils import get_active_consultant_for_client
             active_consultant = get_active_consultant_for_client(user)
             if not active_consultant:
-                from rest_framework.exceptions import ValidationError
                 raise ValidationError("You don't have an assigned consultant yet.")
             
             serializer.save(client=user, consultant=active_consultant, uploaded_by=user)
@@ -865,6 +986,6 @@ class LegalNoticeViewSet(viewsets.ModelViewSet):
     def toggle_resolved(self, request, pk=None):
         notice = self.get_object()
         notice.is_resolved = not notice.is_resolved
-        notice.save()
+        notice.save(update_fields=['is_resolved'])
         return Response({'status': 'success', 'is_resolved': notice.is_resolved})
 
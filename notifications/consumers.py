@@ -5,6 +5,8 @@ from channels.generic.websocket import AsyncWebsocketConsumer
 logger = logging.getLogger(__name__)
 
 class NotificationConsumer(AsyncWebsocketConsumer):
+    channel_layer_alias = 'notifications'
+
     async def connect(self):
         self.user = self.scope.get("user")
         print(f"[WS NOTIF] Connecting attempt for user: {self.user}")
@@ -110,7 +110,7 @@ def create_and_push_notification(recipient, category, title, message, link=''):
         )
         _debug_console(f"[NOTIFICATION] Created in DB: id={notification.id}")
 
-        channel_layer = get_channel_layer()
+        channel_layer = get_channel_layer('notifications')
         group_name = f"user_{recipient.id}"
 
         async_to_sync(channel_layer.group_send)(
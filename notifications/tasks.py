@@ -39,7 +39,7 @@ def send_whatsapp_text_task(self, phone_number, text, message_id=None):
             # Broadcast delivery status to the conversation's WebSocket group
             from channels.layers import get_channel_layer
             from asgiref.sync import async_to_sync
-            channel_layer = get_channel_layer()
+            channel_layer = get_channel_layer('chat')
             async_to_sync(channel_layer.group_send)(
                 f"chat_{msg.conversation.id}",
                 {
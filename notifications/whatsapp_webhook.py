@@ -194,7 +194,7 @@ class WhatsAppWebhookView(APIView):
             logger.info(f"Saved WhatsApp msg to DB: {msg.id} (sender={conv.client.username})")
             
             # Broadcast via Channels
-            channel_layer = get_channel_layer()
+            channel_layer = get_channel_layer('chat')
             async_to_sync(channel_layer.group_send)(
                 f'chat_{conv.id}',
                 {
@@ -366,7 +366,7 @@ class WhatsAppWebhookView(APIView):
                 if updated_count > 0:
                     logger.info(f"Marked {updated_count} messages read for WA client {phone_number}")
                     # Broadcast the read receipt to the consultant's dashboard instantly
-                    channel_layer = get_channel_layer()
+                    channel_layer = get_channel_layer('chat')
                     async_to_sync(channel_layer.group_send)(
                         f'chat_{conv.id}',
                         {
@@ -0,0 +1,55 @@
+from decimal import Decimal
+
+from django.test import TestCase
+
+from consultants.models import ClientServiceRequest, ConsultantServiceProfile, Service, ServiceCategory
+from core_auth.models import User
+from service_orders.models import OrderItem, ServiceOrder
+from service_orders.utils import create_service_requests_from_order
+
+
+class CreateServiceRequestsFromOrderTests(TestCase):
+    def setUp(self):
+        consultant = User.objects.create_user(
+            username='order_consultant',
+            email='order-consultant@example.com',
+            password='password',
+            role=User.CONSULTANT,
+        )
+        self.profile = ConsultantServiceProfile.objects.create(user=consultant, qualification='CA')
+        # No email or phone, so no notification tasks are queued
+        self.customer = User.objects.create_user(username='order_client', password='password', role=User.CLIENT)
+        self.service = Service.objects.create(
+            category=ServiceCategory.objects.create(name='Returns'),
+            title='ITR Salary Filing',
+            price=Decimal('1499.00'),
+        )
+        self.order = ServiceOrder.objects.create(user=self.customer, total_amount=Decimal('1499.00'), status='paid')
+        OrderItem.objects.create(
+            order=self.order,
+            service=self.service,
+            selected_consultant=self.profile,
+            selection_mode='manual',
+            category='Returns',
+            service_title='ITR Salary Filing',
+            price=Decimal('1499.00'),
+        )
+
+    def test_selected_consultant_is_assigned_directly(self):
+        created = create_service_requests_from_order(self.order)
+
+        self.assertEqual(len(created), 1)
+        self.assertEqual(created[0]['status'], 'assigned')
+        self.assertEqual(created[0]['consultant']['id'], self.profile.id)
+        request = ClientServiceRequest.objects.get(id=created[0]['request_id'])
+        self.assertEqual(request.assigned_consultant_id, self.profile.id)
+        self.assertIsNotNone(request.assigned_at)
+        self.profile.refresh_from_db()
+        self.assertEqual(self.profile.current_client_count, 1)
+        self.assertIsNotNone(self.profile.last_assigned_at)
+
+    def test_processing_an_order_twice_creates_nothing(self):
+        create_service_requests_from_order(self.order)
+
+        self.assertEqual(create_service_requests_from_order(self.order), [])
+        self.assertEqual(ClientServiceRequest.objects.filter(client=self.customer).count(), 1)
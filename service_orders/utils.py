@@ -17,7 +17,7 @@ logger = logging.getLogger(__name__)
 
 
 def _push_realtime_notification(notification, *, extra_payload=None):
-    channel_layer = get_channel_layer()
+    channel_layer = get_channel_layer('notifications')
     if not channel_layer:
         return
 
@@ -70,12 +70,10 @@ def create_service_requests_from_order(order):
     created_requests = []
     
     # Idempotency Check: See if requests already exist for this order
-    existing_count = ClientServiceRequest.objects.filter(
+    if ClientServiceRequest.objects.filter(
         client=order.user,
         notes__contains=f'order #{order.id}'
-    ).count()
-    
-    if existing_count > 0:
+    ).exists():
         return [] # Already processed
 
     # Resolve contact details once for all items in this order
@@ -113,19 +111,18 @@ def create_service_requests_from_order(order):
             request.assigned_consultant = consultant
             request.status = 'assigned'
             request.assigned_at = timezone.now()
-            request.save()
+            request.save(update_fields=['assigned_consultant', 'status', 'assigned_at', 'updated_at'])
             
             # Increment consultant's current client count atomically
             consultant.current_client_count = F('current_client_count') + 1
             consultant.last_assigned_at = timezone.now()
-            consultant.save()
-            consultant.refresh_from_db()
+            consultant.save(update_fields=['current_client_count', 'last_assigned_at', 'updated_at'])
+            consultant.refresh_from_db(fields=['current_client_count'])
         else:
             # Auto mode: Use existing affinity + round-robin logic
             consultant = assign_consultant_to_request(request.id)
-        
-        # Refresh to get updated status
-        request.refresh_from_db()
+            # Refresh to get the status set by the assignment
+            request.refresh_from_db()
         
         service_title_for_email = getattr(item.service, 'title', getattr(item, 'service_title', 'Custom Service'))
 
@@ -260,7 +260,7 @@ def _create_and_push_notification(
         link=link or '',
     )
 
-    channel_layer = get_channel_layer()
+    channel_layer = get_channel_layer('notifications')
     if channel_layer:
         payload = NotificationSerializer(notification).data
         if isinstance(extra_payload, dict):
@@ -856,7 +856,7 @@ def request_additional_service(request):
 
             def _push_payment_request():
                 try:
-                    channel_layer = get_channel_layer()
+                    channel_layer = get_channel_layer('notifications')
                     if channel_layer is None:
                         logger.warning(
                             'Channel layer unavailable; skipping realtime PAYMENT_REQUEST push for order %s',